@@ -1,7 +1,7 @@
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.simulator.card.card_factory import CardFactory
 from src.simulator.card.deck import Deck
@@ -14,7 +14,7 @@ from src.simulator.simulation.game_data import GameData
 from src.team_builder.env.env import LLSIFTeamBuildingEnv
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkCaseConfig:
     """Configuration for a single benchmark case, loaded from its config.json."""
 
@@ -31,21 +31,32 @@ class BenchmarkCase:
     This object encapsulates one benchmarking scenario.
     """
 
-    def __init__(self, case_path: Path, master_data_path: Path = Path("./data")):
+    def __init__(
+        self,
+        case_path: Path,
+        master_data_path: Path = Path("./data"),
+        card_factory: Optional[CardFactory] = None,
+        accessory_factory: Optional[AccessoryFactory] = None,
+        sis_factory: Optional[SISFactory] = None,
+        song_factory: Optional[SongFactory] = None,
+        game_data: Optional[GameData] = None,
+    ):
         self.path = case_path
         self.name = case_path.name
         self.master_data_path = master_data_path
 
         self.config = self._load_config()
-        self._init_factories()
+        self._init_factories(card_factory, accessory_factory, sis_factory, song_factory)
 
         self.deck = self._load_deck()
         self.accessory_manager = self._load_accessories()
         self.sis_manager = self._load_sis()
+        self.sis_ids_by_name = self._index_sis_by_name()
         self.song = self.song_factory.create_song(
             (self.config.song_name, self.config.song_difficulty)
         )
-        self.game_data = GameData(str(master_data_path))
+        self.game_data = game_data or GameData(str(master_data_path))
+        self._env: Optional[LLSIFTeamBuildingEnv] = None
 
     def _load_config(self) -> BenchmarkCaseConfig:
         """Load benchmark case configuration from config.json."""
@@ -55,25 +66,36 @@ class BenchmarkCase:
                 f"Config file not found in benchmark case: {config_path}"
             )
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
+        data = json.loads(config_path.read_bytes())
         return BenchmarkCaseConfig(**data)
 
-    def _init_factories(self):
-        """Initialize all factories from master data."""
-        self.card_factory = CardFactory(
+    def _init_factories(
+        self,
+        card_factory: Optional[CardFactory] = None,
+        accessory_factory: Optional[AccessoryFactory] = None,
+        sis_factory: Optional[SISFactory] = None,
+        song_factory: Optional[SongFactory] = None,
+    ):
+        """
+        Initialize all factories, reusing any shared factories that were passed in
+        and loading the rest from master data.
+        """
+        self.card_factory = card_factory or CardFactory(
             cards_json_path=str(self.master_data_path / "cards.json"),
             level_caps_json_path=str(self.master_data_path / "level_caps.json"),
             level_cap_bonuses_path=str(
                 self.master_data_path / "level_cap_bonuses.json"
             ),
         )
-        self.accessory_factory = AccessoryFactory(
+        self.accessory_factory = accessory_factory or AccessoryFactory(
             str(self.master_data_path / "accessories.json")
         )
-        self.sis_factory = SISFactory(str(self.master_data_path / "sis.json"))
-        self.song_factory = SongFactory(str(self.master_data_path / "songs.json"))
+        self.sis_factory = sis_factory or SISFactory(
+            str(self.master_data_path / "sis.json")
+        )
+        self.song_factory = song_factory or SongFactory(
+            str(self.master_data_path / "songs.json")
+        )
 
     def _load_deck(self) -> Deck:
         """Load deck from the benchmark case's deck.json."""
@@ -93,8 +115,30 @@ class BenchmarkCase:
         manager.load(str(self.path / "sis.json"))
         return manager
 
+    def _index_sis_by_name(self) -> Dict[str, Tuple[int, ...]]:
+        """Group the case's SIS manager IDs by SIS name, in manager order."""
+        grouped: Dict[str, List[int]] = {}
+        for ps in self.sis_manager.skills.values():
+            grouped.setdefault(ps.sis.name, []).append(ps.manager_internal_id)
+        return {name: tuple(ids) for name, ids in grouped.items()}
+
     def get_env(self) -> LLSIFTeamBuildingEnv:
-        """Get a configured environment for this benchmark case."""
+        """
+        Get a configured environment for this benchmark case.
+
+        The environment is built on first use and reused afterwards; callers
+        are expected to call `env.reset()` before each episode.
+        """
+        if self._env is None:
+            self._env = self._create_env()
+        elif self._env.guest_manager:
+            # The guest manager outlives env.reset(); clear the previous
+            # run's choice so every model starts from a fresh environment.
+            self._env.guest_manager.current_guest = None
+        return self._env
+
+    def _create_env(self) -> LLSIFTeamBuildingEnv:
+        """Construct a new environment from this case's loaded data."""
         env_kwargs = {
             "deck": self.deck,
             "accessory_manager": self.accessory_manager,
@@ -1,58 +1,224 @@
-import sys
+import logging
+import multiprocessing
+import os
 import json
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
 
 from benchmark.benchmark_case import BenchmarkCase
 from benchmark.model_evaluator import ModelEvaluator
 from benchmark.results_manager import ResultsManager
+from src.simulator.accessory.accessory_factory import AccessoryFactory
+from src.simulator.card.card_factory import CardFactory
+from src.simulator.simulation.game_data import GameData
+from src.simulator.sis.sis_factory import SISFactory
+from src.simulator.song.song_factory import SongFactory
+
+log = logging.getLogger(__name__)
+
+# Per-process state for parallel evaluation, populated by _init_worker.
+_worker_evaluator: Optional[ModelEvaluator] = None
+_worker_cases: List[BenchmarkCase] = []
+
+
+def _evaluate_case(
+    evaluator: ModelEvaluator,
+    case: BenchmarkCase,
+    prediction: Optional[Tuple[Dict[str, Any], int]] = None,
+) -> Dict:
+    """Evaluates a single case, converting expected failures into an error result."""
+    try:
+        return evaluator.evaluate_on_case(case, prediction)
+    except (RuntimeError, ValueError, KeyError, FileNotFoundError) as e:
+        log.error("  > CRITICAL ERROR during evaluation of '%s': %s", case.name, e)
+        return {"case_name": case.name, "error": str(e)}
+
+
+def _init_worker(
+    shared_evaluator: Optional[ModelEvaluator],
+    model_path: Path,
+    num_simulations: int,
+    cases: List[BenchmarkCase],
+) -> None:
+    """
+    Sets up a worker process with an evaluator and the cases for lookup.
+
+    A `shared_evaluator` loaded by the parent is inherited as-is on fork;
+    otherwise the worker loads its own copy of the model.
+    """
+    global _worker_evaluator, _worker_cases  # pylint: disable=global-statement
+    # Forked workers inherit the parent's handler; spawned ones need their own.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    warnings.filterwarnings("ignore", category=UserWarning)
+    _worker_evaluator = shared_evaluator or ModelEvaluator(
+        model_path, num_simulations=num_simulations
+    )
+    _worker_cases = cases
+
+
+def _evaluate_case_in_worker(case_idx: int) -> Dict:
+    """Evaluates one case by index using the worker's preloaded model."""
+    return _evaluate_case(_worker_evaluator, _worker_cases[case_idx])
 
 
 class BenchmarkRunner:
     """Main class for discovering benchmark cases and orchestrating model benchmarks."""
 
+    MAX_CASE_LOADER_THREADS = 8
+
     def __init__(
         self,
         suite_dir: Path = Path("./data/model_eval"),
         master_data_path: Path = Path("./data"),
         results_dir: Path = Path("./results"),
         num_simulations: int = 1000,
+        max_workers: int = 1,
     ):
         self.suite_dir = suite_dir
         self.master_data_path = master_data_path
         self.num_simulations = num_simulations
+        self.max_workers = max(1, max_workers)
         self.results_manager = ResultsManager(results_dir)
+        self._init_shared_factories()
         self.benchmark_cases = self._load_benchmark_cases()
 
+    def _init_shared_factories(self):
+        """Load master data once so every benchmark case can share it."""
+        self.card_factory = CardFactory(
+            cards_json_path=str(self.master_data_path / "cards.json"),
+            level_caps_json_path=str(self.master_data_path / "level_caps.json"),
+            level_cap_bonuses_path=str(
+                self.master_data_path / "level_cap_bonuses.json"
+            ),
+        )
+        self.accessory_factory = AccessoryFactory(
+            str(self.master_data_path / "accessories.json")
+        )
+        self.sis_factory = SISFactory(str(self.master_data_path / "sis.json"))
+        self.song_factory = SongFactory(str(self.master_data_path / "songs.json"))
+        self.game_data = GameData(str(self.master_data_path))
+
+    def _load_case(self, case_path: Path) -> BenchmarkCase:
+        """Load a single benchmark case using the shared master data."""
+        return BenchmarkCase(
+            case_path,
+            self.master_data_path,
+            card_factory=self.card_factory,
+            accessory_factory=self.accessory_factory,
+            sis_factory=self.sis_factory,
+            song_factory=self.song_factory,
+            game_data=self.game_data,
+        )
+
     def _load_benchmark_cases(self) -> List[BenchmarkCase]:
         """Load all valid benchmark cases from the suite directory."""
-        print(f"Loading benchmark cases from: {self.suite_dir}")
+        log.info("Loading benchmark cases from: %s", self.suite_dir)
         if not self.suite_dir.exists():
-            print(
-                f"Error: Benchmark suite directory not found at '{self.suite_dir}'",
-                file=sys.stderr,
+            log.error(
+                "Error: Benchmark suite directory not found at '%s'", self.suite_dir
             )
             return []
 
+        case_dirs = [
+            item
+            for item in self.suite_dir.iterdir()
+            if item.is_dir() and (item / "config.json").exists()
+        ]
+
         loaded_cases = []
-        for item in sorted(self.suite_dir.iterdir()):
-            if item.is_dir() and (item / "config.json").exists():
-                try:
-                    case = BenchmarkCase(item, self.master_data_path)
-                    loaded_cases.append(case)
-                    print(f"  > Loaded case: {item.name}")
-                except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
-                    print(
-                        f"  > Failed to load case '{item.name}': Invalid or missing file/key. Error: {e}",
-                        file=sys.stderr,
-                    )
+        if case_dirs:
+            num_threads = min(self.MAX_CASE_LOADER_THREADS, len(case_dirs))
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                futures = {
+                    executor.submit(self._load_case, item): item for item in case_dirs
+                }
+                for future in as_completed(futures):
+                    item = futures[future]
+                    try:
+                        loaded_cases.append(future.result())
+                        log.info("  > Loaded case: %s", item.name)
+                    except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
+                        log.error(
+                            "  > Failed to load case '%s': Invalid or missing file/key. Error: %s",
+                            item.name,
+                            e,
+                        )
+
+        # Cases finish loading in any order; keep the suite order deterministic.
+        loaded_cases.sort(key=lambda case: case.name)
 
         if not loaded_cases:
-            print("Warning: No valid benchmark cases were found.", file=sys.stderr)
+            log.warning("Warning: No valid benchmark cases were found.")
 
         return loaded_cases
 
+    def _predict_all_teams(
+        self, evaluator: ModelEvaluator
+    ) -> List[Optional[Tuple[Dict[str, Any], int]]]:
+        """
+        Predicts teams for all cases with a single batched rollout.
+
+        If the batched rollout fails, no predictions are returned so that each
+        case predicts on its own and any error is attributed to that case.
+        """
+        log.info("  > Predicting teams for %d cases...", len(self.benchmark_cases))
+        try:
+            return evaluator.predict_teams(
+                [case.get_env() for case in self.benchmark_cases]
+            )
+        except (RuntimeError, ValueError, KeyError) as e:
+            log.warning(
+                "  > Batched prediction failed (%s). Predicting per case instead.", e
+            )
+            return [None] * len(self.benchmark_cases)
+
+    def _evaluate_model(self, model_path: Path) -> List[Dict]:
+        """
+        Evaluates a model on every benchmark case, returning results in case order.
+
+        Cases are independent, so when `max_workers` > 1 they are distributed
+        across a process pool. With the fork start method the model is loaded
+        once here and its weights are shared with the workers; other start
+        methods load the model once per worker.
+        """
+        num_workers = min(self.max_workers, len(self.benchmark_cases))
+        load_in_parent = (
+            num_workers <= 1 or multiprocessing.get_start_method() == "fork"
+        )
+        evaluator = (
+            ModelEvaluator(model_path, num_simulations=self.num_simulations)
+            if load_in_parent
+            else None
+        )
+
+        if num_workers <= 1:
+            predictions = self._predict_all_teams(evaluator)
+            return [
+                _evaluate_case(evaluator, case, prediction)
+                for case, prediction in zip(self.benchmark_cases, predictions)
+            ]
+
+        if evaluator is not None:
+            evaluator.model.policy.share_memory()
+
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(
+                evaluator,
+                model_path,
+                self.num_simulations,
+                self.benchmark_cases,
+            ),
+        ) as executor:
+            return list(
+                executor.map(
+                    _evaluate_case_in_worker, range(len(self.benchmark_cases))
+                )
+            )
+
     def run(
         self,
         models_to_test: Dict[str, Path],
@@ -68,64 +234,48 @@ class BenchmarkRunner:
             save_report: If True, saves a report to a Markdown file.
         """
         if not self.benchmark_cases:
-            print(
-                "Cannot run benchmark: No benchmark cases were loaded.", file=sys.stderr
-            )
+            log.error("Cannot run benchmark: No benchmark cases were loaded.")
             return
 
         all_model_results = {}
         for model_name, model_path in models_to_test.items():
-            print("\n" + "-" * 80)
-            print(f"BENCHMARKING MODEL: {model_name}")
-            print(f"Path: {model_path}")
-            print("-" * 80)
+            log.info("\n%s", "-" * 80)
+            log.info("BENCHMARKING MODEL: %s", model_name)
+            log.info("Path: %s", model_path)
+            log.info("-" * 80)
 
             if not model_path.exists():
-                print(
-                    f"Error: Model file not found for '{model_name}'. Skipping.",
-                    file=sys.stderr,
-                )
+                log.error("Error: Model file not found for '%s'. Skipping.", model_name)
                 continue
 
-            evaluator = ModelEvaluator(model_path, num_simulations=self.num_simulations)
-
-            model_results = []
-            for case in self.benchmark_cases:
-                try:
-                    result = evaluator.evaluate_on_case(case)
-                    model_results.append(result)
-                except (RuntimeError, ValueError, KeyError, FileNotFoundError) as e:
-                    print(
-                        f"  > CRITICAL ERROR during evaluation of '{case.name}': {e}",
-                        file=sys.stderr,
-                    )
-                    model_results.append({"case_name": case.name, "error": str(e)})
-
+            model_results = self._evaluate_model(model_path)
             all_model_results[model_name] = model_results
 
+            timestamp = self.results_manager.make_timestamp()
             if save_json:
-                self.results_manager.save_results(model_name, model_results)
+                self.results_manager.save_results(model_name, model_results, timestamp)
             if save_report:
-                self.results_manager.save_report(model_name, model_results)
+                self.results_manager.save_report(model_name, model_results, timestamp)
 
         if len(all_model_results) > 1:
             self.results_manager.compare_models(all_model_results)
 
-        print("\nBenchmark suite finished.")
+        log.info("\nBenchmark suite finished.")
 
 
 def main():
     """Defines the models to test and runs the suite."""
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     warnings.filterwarnings("ignore", category=UserWarning)
-    
+
     models_to_benchmark = {
         "llsif_ppo_agent_final": Path("./models/llsif_ppo/llsif_ppo_agent_final.zip"),
         "best_model": Path("./models/llsif_ppo/best_model.zip"),
         "750k": Path("./models/llsif_ppo/llsif_ppo_agent_checkpoint_750000_steps.zip"),
     }
 
-    runner = BenchmarkRunner(num_simulations=1000)
+    runner = BenchmarkRunner(num_simulations=1000, max_workers=os.cpu_count() or 1)
     runner.run(models_to_benchmark)
 
 
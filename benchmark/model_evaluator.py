@@ -1,8 +1,8 @@
+import logging
 import time
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from sb3_contrib import MaskablePPO
@@ -14,6 +14,11 @@ from src.simulator.team.guest import Guest
 from src.team_builder.env.env import LLSIFTeamBuildingEnv
 from benchmark.benchmark_case import BenchmarkCase
 
+log = logging.getLogger(__name__)
+
+# Extracts the guest's ID from the formatted GuestData string in the env's final team data.
+_GUEST_ID_RE = re.compile(r"leader_skill_id=(\d+)")
+
 
 class ModelEvaluator:
     """Evaluates a trained model on a given BenchmarkCase."""
@@ -25,37 +30,46 @@ class ModelEvaluator:
         self.num_simulations = num_simulations
         self.deterministic = deterministic
         self.model = MaskablePPO.load(str(model_path))
-        print(f"Loaded model from: {self.model_path}")
+        log.info("Loaded model from: %s", self.model_path)
 
-    def evaluate_on_case(self, case: BenchmarkCase) -> Dict:
+    def evaluate_on_case(
+        self,
+        case: BenchmarkCase,
+        prediction: Optional[Tuple[Dict[str, Any], int]] = None,
+    ) -> Dict:
         """
         Evaluate the model on a single benchmark case.
 
+        If `prediction` is given (e.g. from `predict_teams`), it is used instead
+        of running the model on the case's environment again.
+
         Returns a dictionary containing detailed results and statistics.
         """
         start_time = time.time()
 
-        env = case.get_env()
-
-        print(f"  > Predicting team for case: {case.name}...")
-        team_data, approach_rate = self._get_model_prediction(env)
+        if prediction is None:
+            log.info("  > Predicting team for case: %s...", case.name)
+            prediction = self._get_model_prediction(case.get_env())
+        team_data, approach_rate = prediction
 
         if not team_data.get("slots"):
-            print("  > Agent failed to build a team. Score is 0.")
+            log.info("  > Agent failed to build a team. Score is 0.")
             return self._create_error_result(case, "Agent did not build a team.")
 
         predicted_team = self._reconstruct_team(team_data, case)
 
-        print(f"  > Running {self.num_simulations} simulations...")
+        log.info("  > Running %d simulations...", self.num_simulations)
         simulation_scores = self._run_simulations(predicted_team, case, approach_rate)
+        if simulation_scores.size == 0:
+            return self._create_error_result(case, "No simulations were run.")
 
         evaluation_time = time.time() - start_time
+        mean_score = float(simulation_scores.mean())
 
-        mean_score = np.mean(simulation_scores) if simulation_scores else 0
-
-        print(
-            f"  > Evaluation complete in {evaluation_time:.2f}s. "
-            f"Mean Score: {mean_score:,.0f}"
+        log.info(
+            "  > Evaluation complete in %.2fs. Mean Score: %s",
+            evaluation_time,
+            f"{mean_score:,.0f}",
         )
 
         return {
@@ -64,9 +78,9 @@ class ModelEvaluator:
             "predicted_approach_rate": approach_rate,
             "simulation_scores": simulation_scores,
             "mean_score": mean_score,
-            "std_score": np.std(simulation_scores) if simulation_scores else 0,
-            "min_score": np.min(simulation_scores) if simulation_scores else 0,
-            "max_score": np.max(simulation_scores) if simulation_scores else 0,
+            "std_score": float(simulation_scores.std()),
+            "min_score": int(simulation_scores.min()),
+            "max_score": int(simulation_scores.max()),
             "evaluation_time": evaluation_time,
         }
 
@@ -74,17 +88,46 @@ class ModelEvaluator:
         self, env: LLSIFTeamBuildingEnv
     ) -> Tuple[Dict[str, Any], int]:
         """Get the model's predicted team and approach rate."""
-        obs, _ = env.reset()
-        done = False
-        info = {}
-        while not done:
-            action, _ = self.model.predict(
-                obs, deterministic=self.deterministic, action_masks=env.action_masks()
+        return self.predict_teams([env])[0]
+
+    def predict_teams(
+        self, envs: List[LLSIFTeamBuildingEnv]
+    ) -> List[Tuple[Dict[str, Any], int]]:
+        """
+        Get the model's predicted team and approach rate for several environments.
+
+        All environments are stepped in lockstep so that each `model.predict`
+        call handles a stacked batch of observations and action masks rather
+        than a single one. Environments that finish early drop out of the batch.
+        """
+        observations = [env.reset()[0] for env in envs]
+        predictions: List[Tuple[Dict[str, Any], int]] = [({}, 1)] * len(envs)
+        active = list(range(len(envs)))
+
+        while active:
+            obs_batch = {
+                key: np.stack([observations[i][key] for i in active])
+                for key in observations[active[0]]
+            }
+            mask_batch = np.stack([envs[i].action_masks() for i in active])
+            actions, _ = self.model.predict(
+                obs_batch, deterministic=self.deterministic, action_masks=mask_batch
             )
-            obs, _, terminated, truncated, info = env.step(int(action))
-            done = terminated or truncated
 
-        return info.get("final_team_data", {}), info.get("final_approach_rate", 1)
+            still_active = []
+            for env_idx, action in zip(active, actions):
+                obs, _, terminated, truncated, info = envs[env_idx].step(int(action))
+                observations[env_idx] = obs
+                if terminated or truncated:
+                    predictions[env_idx] = (
+                        info.get("final_team_data", {}),
+                        info.get("final_approach_rate", 1),
+                    )
+                else:
+                    still_active.append(env_idx)
+            active = still_active
+
+        return predictions
 
     def _reconstruct_team(self, team_data: Dict[str, Any], case: BenchmarkCase) -> Team:
         """Reconstructs a Team object from the logged data for a stateless, robust evaluation."""
@@ -93,13 +136,11 @@ class ModelEvaluator:
 
         guest_str = team_data.get("guest", "None")
         if guest_str != "None" and team.guest_manager:
-            match = re.search(r"leader_skill_id=(\d+)", guest_str)
+            match = _GUEST_ID_RE.search(guest_str)
             if match:
                 team.guest_manager.set_guest(int(match.group(1)))
 
-        unassigned_sis = defaultdict(list)
-        for ps in case.sis_manager.skills.values():
-            unassigned_sis[ps.sis.name].append(ps.manager_internal_id)
+        unassigned_sis = {name: list(ids) for name, ids in case.sis_ids_by_name.items()}
 
         for slot_data in team_data.get("slots", []):
             slot_num = slot_data["slot_number"]
@@ -117,13 +158,19 @@ class ModelEvaluator:
 
     def _run_simulations(
         self, team: Team, case: BenchmarkCase, approach_rate: int
-    ) -> List[int]:
-        """Run multiple simulations with the predicted team."""
+    ) -> np.ndarray:
+        """
+        Run multiple simulations with the predicted team.
+
+        Scores are kept as an int64 array; they are only converted to a list
+        when the results are serialized.
+        """
         if not case.song:
-            print(
-                f"  > ERROR: Song could not be loaded for case '{case.name}'. Skipping simulations."
+            log.error(
+                "  > ERROR: Song could not be loaded for case '%s'. Skipping simulations.",
+                case.name,
             )
-            return []
+            return np.empty(0, dtype=np.int64)
 
         play_config = PlayConfig(
             accuracy=case.config.accuracy,
@@ -132,7 +179,7 @@ class ModelEvaluator:
             enable_logging=False,
         )
         play = Play(team, case.song, play_config, case.game_data)
-        return play.simulate(n_trials=self.num_simulations)
+        return np.asarray(play.simulate(n_trials=self.num_simulations), dtype=np.int64)
 
     def _extract_team_info(self, team: Team) -> Dict:
         """Extract serializable team information for logging."""
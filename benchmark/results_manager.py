@@ -1,10 +1,17 @@
 import json
-from datetime import datetime
+import logging
+import math
+import os
+import time
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 import numpy as np
-import pandas as pd
+
+log = logging.getLogger(__name__)
+
+# One row of the per-case team table in the Markdown report.
+_format_slot_row = "| {position} | {card} | {acc} | {sis_count} |\n".format_map
 
 
 class ResultsManager:
@@ -13,10 +20,24 @@ class ResultsManager:
     def __init__(self, results_dir: Path = Path("./results")):
         self.results_dir = results_dir
         self.results_dir.mkdir(exist_ok=True)
-
-    def save_results(self, model_name: str, results: List[Dict]) -> Path:
-        """Saves the complete benchmark results for a model to a JSON file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Summaries keyed by id() of the results list they were generated from.
+        self._summary_cache: Dict[int, Tuple[List[Dict], Dict]] = {}
+
+    @staticmethod
+    def make_timestamp() -> str:
+        """Returns the current time formatted for use in result filenames."""
+        return time.strftime("%Y%m%d_%H%M%S")
+
+    def save_results(
+        self, model_name: str, results: List[Dict], timestamp: Optional[str] = None
+    ) -> Path:
+        """
+        Saves the complete benchmark results for a model to a JSON file.
+
+        Pass the same `timestamp` to `save_report` to give both files matching
+        names.
+        """
+        timestamp = timestamp or self.make_timestamp()
         filename = f"{model_name}_{timestamp}_results.json"
         filepath = self.results_dir / filename
 
@@ -27,64 +48,108 @@ class ResultsManager:
             "summary": self._generate_summary(results),
         }
 
-        save_data = self._convert_for_json(save_data)
+        # Serialize up front so the file is written in one go, then swap it in
+        # so a failed save never leaves a half-written results file behind.
+        payload = json.dumps(save_data, indent=2, default=self._json_default)
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+        tmp_path.write_bytes(payload.encode("utf-8"))
+        os.replace(tmp_path, filepath)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2)
-
-        print(f"  > Full results saved to: {filepath}")
+        log.info("  > Full results saved to: %s", filepath)
         return filepath
 
-    def save_report(self, model_name: str, results: List[Dict]) -> Path:
+    def save_report(
+        self, model_name: str, results: List[Dict], timestamp: Optional[str] = None
+    ) -> Path:
         """Generates and saves a human-readable Markdown report."""
         report = self._generate_markdown_report(model_name, results)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or self.make_timestamp()
         filename = f"{model_name}_{timestamp}_report.md"
         filepath = self.results_dir / filename
 
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(report)
 
-        print(f"  > Markdown report saved to: {filepath}")
+        log.info("  > Markdown report saved to: %s", filepath)
         return filepath
 
     def compare_models(self, all_results: Dict[str, List[Dict]]):
         """Prints a comparison table of multiple models to the console."""
-        comparison_data = []
-        for model_name, results in all_results.items():
-            summary = self._generate_summary(results)
-            comparison_data.append(
-                {
-                    "Model": model_name,
-                    "Avg Score": summary["overall_mean"],
-                    "Std Dev": summary["overall_std"],
-                    "Best Case": f"{summary['best_score']:,.0f} ({summary['best_case']})",
-                    "Worst Case": f"{summary['worst_score']:,.0f} ({summary['worst_case']})",
-                    "Time (s)": summary["total_time"],
-                }
-            )
-
-        if not comparison_data:
+        num_models = len(all_results)
+        if num_models == 0:
             print("No results to compare.")
             return
 
-        df = pd.DataFrame(comparison_data)
-        df = df.sort_values("Avg Score", ascending=False).reset_index(drop=True)
-        df["Rank"] = df.index + 1
-        df = df.set_index("Rank")
+        names: List[str] = []
+        best_cases: List[str] = []
+        worst_cases: List[str] = []
+        means = np.empty(num_models, dtype=np.float64)
+        stds = np.empty(num_models, dtype=np.float64)
+        times = np.empty(num_models, dtype=np.float64)
+        for i, (model_name, results) in enumerate(all_results.items()):
+            summary = self._generate_summary(results)
+            names.append(model_name)
+            means[i] = summary["overall_mean"]
+            stds[i] = summary["overall_std"]
+            times[i] = summary["total_time"]
+            best_cases.append(f"{summary['best_score']:,.0f} ({summary['best_case']})")
+            worst_cases.append(
+                f"{summary['worst_score']:,.0f} ({summary['worst_case']})"
+            )
+
+        order = np.argsort(-means, kind="stable")
+        columns = [
+            "Rank",
+            "Model",
+            "Avg Score",
+            "Std Dev",
+            "Best Case",
+            "Worst Case",
+            "Time (s)",
+        ]
+        rows = [
+            [
+                str(rank),
+                names[i],
+                f"{means[i]:,.0f}",
+                f"{stds[i]:,.0f}",
+                best_cases[i],
+                worst_cases[i],
+                f"{times[i]:.2f}",
+            ]
+            for rank, i in enumerate(order, start=1)
+        ]
+        widths = [
+            max(len(column), *(len(row[col]) for row in rows))
+            for col, column in enumerate(columns)
+        ]
 
         print("\n" + "=" * 80)
         print("MODEL BENCHMARK COMPARISON")
         print("=" * 80)
-        df["Avg Score"] = df["Avg Score"].map("{:,.0f}".format)
-        df["Std Dev"] = df["Std Dev"].map("{:,.0f}".format)
-        df["Time (s)"] = df["Time (s)"].map("{:.2f}".format)
-        print(df.to_string())
+        for row in [columns, *rows]:
+            print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
         print("=" * 80 + "\n")
 
     def _generate_summary(self, results: List[Dict]) -> Dict:
-        """Helper to generate summary statistics from a list of results."""
+        """
+        Helper to generate summary statistics from a list of results.
+
+        The same results list is summarized when it is saved, reported and
+        compared, so the summary is cached per list. The list itself is kept
+        alongside the summary so a recycled id() can never return a stale entry.
+        """
+        cached = self._summary_cache.get(id(results))
+        if cached is not None and cached[0] is results:
+            return cached[1]
+
+        summary = self._compute_summary(results)
+        self._summary_cache[id(results)] = (results, summary)
+        return summary
+
+    def _compute_summary(self, results: List[Dict]) -> Dict:
+        """Computes summary statistics for the valid results in a list."""
         valid_results = [r for r in results if "error" not in r]
         if not valid_results:
             return {
@@ -97,13 +162,19 @@ class ResultsManager:
                 "total_time": 0,
             }
 
+        # Only a handful of cases per model, so plain Python beats numpy here.
         mean_scores = [r["mean_score"] for r in valid_results]
-        best_idx = np.argmax(mean_scores)
-        worst_idx = np.argmin(mean_scores)
+        num_scores = len(mean_scores)
+        overall_mean = sum(mean_scores) / num_scores
+        variance = (
+            sum((score - overall_mean) ** 2 for score in mean_scores) / num_scores
+        )
+        best_idx = max(range(num_scores), key=mean_scores.__getitem__)
+        worst_idx = min(range(num_scores), key=mean_scores.__getitem__)
 
         return {
-            "overall_mean": np.mean(mean_scores),
-            "overall_std": np.std(mean_scores),
+            "overall_mean": overall_mean,
+            "overall_std": math.sqrt(variance),
             "best_score": mean_scores[best_idx],
             "best_case": valid_results[best_idx]["case_name"],
             "worst_score": mean_scores[worst_idx],
@@ -114,42 +185,55 @@ class ResultsManager:
     def _generate_markdown_report(self, model_name: str, results: List[Dict]) -> str:
         """Helper to format the detailed Markdown report."""
         summary = self._generate_summary(results)
-        report = f"# Benchmark Report: {model_name}\n\n"
-        report += "## Overall Summary\n"
-        report += f"- **Average Score**: {summary['overall_mean']:,.0f} (±{summary['overall_std']:,.0f})\n"
-        report += f"- **Best Performance**: {summary['best_score']:,.0f} on `{summary['best_case']}`\n"
-        report += f"- **Worst Performance**: {summary['worst_score']:,.0f} on `{summary['worst_case']}`\n\n"
+        parts: List[str] = []
+        add = parts.append
+        add(f"# Benchmark Report: {model_name}\n\n")
+        add("## Overall Summary\n")
+        add(f"- **Average Score**: {summary['overall_mean']:,.0f} (±{summary['overall_std']:,.0f})\n")
+        add(f"- **Best Performance**: {summary['best_score']:,.0f} on `{summary['best_case']}`\n")
+        add(f"- **Worst Performance**: {summary['worst_score']:,.0f} on `{summary['worst_case']}`\n\n")
 
         for result in results:
-            report += f"## Benchmark Case: `{result['case_name']}`\n"
+            add(f"## Benchmark Case: `{result['case_name']}`\n")
             if "error" in result:
-                report += f"**Status:** FAILED\n**Reason:** {result['error']}\n\n"
+                add(f"**Status:** FAILED\n**Reason:** {result['error']}\n\n")
                 continue
 
-            report += f"- **Mean Score**: {result['mean_score']:,.0f} (±{result['std_score']:,.0f})\n"
+            add(f"- **Mean Score**: {result['mean_score']:,.0f} (±{result['std_score']:,.0f})\n")
             team = result["predicted_team"]
             stats = team["total_stats"]
-            report += f"- **Team Stats (S/P/C)**: {stats['smile']:,}/{stats['pure']:,}/{stats['cool']:,}\n"
-            report += "| Slot | Card | Accessory | SIS |\n"
-            report += "|:----:|:-----|:----------|:----|\n"
-            for slot in team["slots"]:
-                card = slot["card"]["name"]
-                acc = slot["accessory"]["name"] if slot["accessory"] else " "
-                sis_count = len(slot["sis"])
-                report += f"| {slot['position']} | {card} | {acc} | {sis_count} |\n"
-            report += "\n"
-        return report
-
-    def _convert_for_json(self, obj: Any) -> Any:
-        """Recursively converts numpy types to native Python types for JSON serialization."""
+            add(f"- **Team Stats (S/P/C)**: {stats['smile']:,}/{stats['pure']:,}/{stats['cool']:,}\n")
+            add("| Slot | Card | Accessory | SIS |\n")
+            add("|:----:|:-----|:----------|:----|\n")
+            rows = [
+                _format_slot_row(
+                    {
+                        "position": slot["position"],
+                        "card": slot["card"]["name"],
+                        "acc": slot["accessory"]["name"] if slot["accessory"] else " ",
+                        "sis_count": len(slot["sis"]),
+                    }
+                )
+                for slot in team["slots"]
+            ]
+            add("".join(rows))
+            add("\n")
+        return "".join(parts)
+
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """
+        Converts numpy types that `json` cannot serialize natively.
+
+        Used as the `default` hook of `json.dump`, so it is only called for the
+        values that need converting rather than for every node of the results.
+        """
         if isinstance(obj, np.ndarray):
             return obj.tolist()
         if isinstance(obj, np.integer):
             return int(obj)
         if isinstance(obj, np.floating):
             return float(obj)
-        if isinstance(obj, dict):
-            return {k: self._convert_for_json(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [self._convert_for_json(v) for v in obj]
-        return obj
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable"
+        )
@@ -38,7 +38,11 @@ class Accessory:
         # --- Level and Stats Initialization ---
         self._skill_level: int = 1
         self.stats: Stats
-        # The setter for skill_level will also initialize stats.
+        self._skill_chance: Optional[float] = None
+        self._skill_value: Optional[Union[int, float]] = None
+        self._skill_threshold: Optional[int] = None
+        self._skill_duration: Optional[Union[int, float]] = None
+        # The setter for skill_level will also initialize stats and skill values.
         self.skill_level = skill_level
 
     @property
@@ -59,15 +63,32 @@ class Accessory:
             raise ValueError("Accessory skill_level must be between 1 and 8.")
         self._skill_level = value
         self._update_stats_from_skill_level()
+        self._update_skill_attributes_from_skill_level()
 
     def _update_stats_from_skill_level(self) -> None:
         """Updates the accessory's stats based on its current skill_level."""
+        stats_by_level = self._data.stats_by_level
         index = self.skill_level - 1
         # Clamp index to protect against accessories with fewer than 16 stat entries
-        clamped_index = max(0, min(index, len(self._data.stats) - 1))
+        clamped_index = max(0, min(index, len(stats_by_level) - 1))
+        self.stats = stats_by_level[clamped_index]
 
-        raw_stats = self._data.stats[clamped_index] if self._data.stats else [0, 0, 0]
-        self.stats = Stats(smile=raw_stats[0], pure=raw_stats[1], cool=raw_stats[2])
+    def _update_skill_attributes_from_skill_level(self) -> None:
+        """
+        Caches the skill attributes for the current skill_level so the
+        skill_* properties are plain attribute reads.
+        """
+        level = self._skill_level
+        self._skill_chance = self.get_skill_attribute_for_level(
+            self.skill.chances, level
+        )
+        self._skill_value = self.get_skill_attribute_for_level(self.skill.values, level)
+        self._skill_threshold = self.get_skill_attribute_for_level(
+            self.skill.thresholds, level
+        )
+        self._skill_duration = self.get_skill_attribute_for_level(
+            self.skill.durations, level
+        )
 
     def get_skill_attribute_for_level(
         self, value_list: List[Any], level: int
@@ -83,36 +104,33 @@ class Accessory:
         if not value_list:
             return None
 
-        index = level - 1
-        clamped_index = max(0, min(index, len(value_list) - 1))
-
-        return value_list[clamped_index]
+        if level < 1:
+            return value_list[0]
+        if level > len(value_list):
+            return value_list[-1]
+        return value_list[level - 1]
 
     # --- Skill Properties (Aligned with Card properties) ---
 
     @property
     def skill_chance(self) -> Optional[float]:
         """Gets the skill's activation chance for the current skill level."""
-        return self.get_skill_attribute_for_level(self.skill.chances, self.skill_level)
+        return self._skill_chance
 
     @property
     def skill_value(self) -> Optional[Union[int, float]]:
         """Gets the skill's effect value for the current skill level."""
-        return self.get_skill_attribute_for_level(self.skill.values, self.skill_level)
+        return self._skill_value
 
     @property
     def skill_threshold(self) -> Optional[int]:
         """Gets the skill's activation threshold for the current skill level."""
-        return self.get_skill_attribute_for_level(
-            self.skill.thresholds, self.skill_level
-        )
+        return self._skill_threshold
 
     @property
     def skill_duration(self) -> Optional[Union[int, float]]:
         """Gets the skill's effect duration for the current skill level."""
-        return self.get_skill_attribute_for_level(
-            self.skill.durations, self.skill_level
-        )
+        return self._skill_duration
 
     def __repr__(self) -> str:
         """Provides a detailed string representation of the accessory's state."""
@@ -124,29 +142,19 @@ class Accessory:
 
         # Skill Info
         skill_lines = [f"  - Skill: Type='{self.skill.type}'"]
-        skill_details_parts = [
-            f"Target: '{self.skill.target}'" if self.skill.target else ""
-        ]
-        skill_details = ", ".join(filter(None, skill_details_parts))
-        if skill_details:
-            skill_lines.append(f"    - Details: {skill_details}")
-
-        skill_values_parts = [
-            f"Chance: {self.skill_chance}%" if self.skill_chance is not None else "",
-            (
-                f"Threshold: {self.skill_threshold}"
-                if self.skill_threshold is not None
-                else ""
-            ),
-            f"Value: {self.skill_value}" if self.skill_value is not None else "",
-            (
-                f"Duration: {self.skill_duration}s"
-                if self.skill_duration is not None
-                else ""
-            ),
-        ]
-        skill_values = ", ".join(filter(None, skill_values_parts))
-        if skill_values:
-            skill_lines.append(f"    - Effects: {skill_values}")
+        if self.skill.target:
+            skill_lines.append(f"    - Details: Target: '{self.skill.target}'")
+
+        skill_values_parts = []
+        if self.skill_chance is not None:
+            skill_values_parts.append(f"Chance: {self.skill_chance}%")
+        if self.skill_threshold is not None:
+            skill_values_parts.append(f"Threshold: {self.skill_threshold}")
+        if self.skill_value is not None:
+            skill_values_parts.append(f"Value: {self.skill_value}")
+        if self.skill_duration is not None:
+            skill_values_parts.append(f"Duration: {self.skill_duration}s")
+        if skill_values_parts:
+            skill_lines.append(f"    - Effects: {', '.join(skill_values_parts)}")
 
         return "\n".join([header, stats_line, *skill_lines])
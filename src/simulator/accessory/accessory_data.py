@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+from src.simulator.accessory.accessory_stats import AccessoryStats
 
 
 @dataclass(frozen=True)
@@ -12,3 +14,17 @@ class AccessoryData:
     card_id: Optional[str] = None
     stats: List[List[int]] = field(default_factory=list)
     skill: Dict[str, Any] = field(default_factory=dict)
+    stats_by_level: Tuple[AccessoryStats, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Builds the per-level stats table once so accessories can share it."""
+        stats_by_level = tuple(
+            AccessoryStats(smile=row[0], pure=row[1], cool=row[2])
+            for row in self.stats
+        )
+        # Accessories without stat rows fall back to zero stats at every level.
+        object.__setattr__(
+            self, "stats_by_level", stats_by_level or (AccessoryStats(),)
+        )
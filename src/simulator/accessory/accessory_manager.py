@@ -113,8 +113,11 @@ class AccessoryManager:
             dir_name = os.path.dirname(filepath)
             if dir_name:
                 os.makedirs(dir_name, exist_ok=True)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=4)
+            payload = json.dumps(self.to_dict(), indent=4).encode("utf-8")
+            tmp_path = f"{filepath}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
             return True
         except (IOError, TypeError) as e:
             warnings.warn(f"Error: Could not save accessories to {filepath}: {e}")
@@ -127,7 +130,7 @@ class AccessoryManager:
             return False
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
+            with open(filepath, "rb") as f:
                 state = json.load(f)
         except (IOError, json.JSONDecodeError) as e:
             warnings.warn(f"Could not load or parse file {filepath}: {e}")
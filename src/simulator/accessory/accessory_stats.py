@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccessoryStats:
     """Holds the core stats for a card in a specific idolization state."""
 
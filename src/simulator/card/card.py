@@ -1,6 +1,6 @@
 import warnings
-from dataclasses import replace
-from typing import Optional, Dict, Any, Union, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Union, List, Tuple
 
 from src.simulator.card.card_data import CardData
 from src.simulator.card.gallery import Gallery
@@ -8,6 +8,10 @@ from src.simulator.card.stats import Stats
 from src.simulator.core.skill import Skill
 from src.simulator.core.leader_skill import LeaderSkill
 
+# Shared stand-in for a leader skill without an "extra" block, so building a
+# card doesn't allocate an empty dict just to read defaults from it.
+_NO_EXTRA = MappingProxyType({})
+
 
 class Card:
     """
@@ -16,12 +20,38 @@ class Card:
     properties based on that state.
     """
 
+    __slots__ = (
+        "_data",
+        "_gallery",
+        "_level_cap_map",
+        "_level_cap_bonus_map",
+        "idolized_status",
+        "_base_stats",
+        "skill",
+        "leader_skill",
+        "card_id",
+        "display_name",
+        "rarity",
+        "attribute",
+        "character",
+        "is_promo",
+        "is_preidolized_non_promo",
+        "level_cap",
+        "level",
+        "_current_skill_level",
+        "_current_sis_slots",
+        "_skill_chance",
+        "_skill_value",
+        "_skill_threshold",
+        "_skill_duration",
+    )
+
     def __init__(
         self,
         card_data: CardData,
         gallery: Gallery,
-        level_cap_map: Dict,
-        level_cap_bonus_map: Dict,
+        level_cap_map: Dict[Tuple[str, str], int],
+        level_cap_bonus_map: Dict[Tuple[str, int], int],
         idolized: bool = True,
         level: Optional[int] = None,
     ):
@@ -69,7 +99,7 @@ class Card:
         )
 
         leader_skill_data = self._data.leader_skill
-        extra_data = leader_skill_data.get("extra", {})
+        extra_data = leader_skill_data.get("extra") or _NO_EXTRA
 
         flat_leader_skill = {
             "attribute": leader_skill_data.get("leader_attribute"),
@@ -83,8 +113,8 @@ class Card:
 
     def _initialize_level(self, provided_level: Optional[int]) -> None:
         """Sets the card's level and applies any level-based stat bonuses."""
-        self.level_cap: int = self._level_cap_map.get(self.rarity, {}).get(
-            self.idolized_status, 1
+        self.level_cap: int = self._level_cap_map.get(
+            (self.rarity, self.idolized_status), 1
         )
         self.level: int = self.level_cap
 
@@ -109,15 +139,9 @@ class Card:
 
     def _apply_level_cap_bonus(self, bonus_type: str) -> None:
         """Adds level-based stat bonuses to the internal base stats."""
-        bonus_map = self._level_cap_bonus_map.get(bonus_type, {})
-        bonus_value = bonus_map.get(str(self.level), 0)
+        bonus_value = self._level_cap_bonus_map.get((bonus_type, self.level), 0)
         if bonus_value > 0:
-            self._base_stats = replace(
-                self._base_stats,
-                smile=self._base_stats.smile + bonus_value,
-                pure=self._base_stats.pure + bonus_value,
-                cool=self._base_stats.cool + bonus_value,
-            )
+            self._base_stats = self._base_stats.with_bonus(bonus_value)
 
     def _set_gallery_reference(self, gallery: Gallery) -> None:
         """
@@ -151,6 +175,24 @@ class Card:
         if not 1 <= value <= 8:
             raise ValueError("Skill level must be between 1 and 8.")
         self._current_skill_level = value
+        self._update_skill_attributes_from_skill_level()
+
+    def _update_skill_attributes_from_skill_level(self) -> None:
+        """
+        Caches the skill attributes for the current skill level so the
+        skill_* properties are plain attribute reads.
+        """
+        level = self._current_skill_level
+        self._skill_chance = self.get_skill_attribute_for_level(
+            self.skill.chances, level
+        )
+        self._skill_value = self.get_skill_attribute_for_level(self.skill.values, level)
+        self._skill_threshold = self.get_skill_attribute_for_level(
+            self.skill.thresholds, level
+        )
+        self._skill_duration = self.get_skill_attribute_for_level(
+            self.skill.durations, level
+        )
 
     @property
     def current_sis_slots(self) -> int:
@@ -178,34 +220,27 @@ class Card:
         if not value_list:
             return None
 
-        index = level - 1
-        clamped_index = max(0, min(index, len(value_list) - 1))
-
-        return value_list[clamped_index]
+        if level < 1:
+            return value_list[0]
+        if level > len(value_list):
+            return value_list[-1]
+        return value_list[level - 1]
 
     @property
     def skill_chance(self) -> Optional[float]:
-        return self.get_skill_attribute_for_level(
-            self.skill.chances, self.current_skill_level
-        )
+        return self._skill_chance
 
     @property
     def skill_value(self) -> Optional[Union[int, float]]:
-        return self.get_skill_attribute_for_level(
-            self.skill.values, self.current_skill_level
-        )
+        return self._skill_value
 
     @property
     def skill_threshold(self) -> Optional[int]:
-        return self.get_skill_attribute_for_level(
-            self.skill.thresholds, self.current_skill_level
-        )
+        return self._skill_threshold
 
     @property
     def skill_duration(self) -> Optional[Union[int, float]]:
-        return self.get_skill_attribute_for_level(
-            self.skill.durations, self.current_skill_level
-        )
+        return self._skill_duration
 
     def __repr__(self) -> str:
         """Provides a detailed, multi-line string representation of the card's state."""
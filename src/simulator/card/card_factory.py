@@ -1,6 +1,6 @@
 import json
 import numbers
-from typing import Optional, Dict, Any, Union, List, Tuple
+from typing import Optional, Dict, Any, Iterable, Union, List, Tuple
 import warnings
 
 from src.simulator.card.card_data import CardData
@@ -8,6 +8,18 @@ from src.simulator.card.card import Card
 from src.simulator.card.gallery import Gallery
 
 
+def _parse_bool(value: Any) -> bool:
+    """Reads a JSON flag that may be stored as a bool or as a "true"/"false" string."""
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == "true"
+
+
+def _is_integral(value: Any) -> bool:
+    """Checks for an integer, trying the exact-type test before the ABC check."""
+    return type(value) is int or isinstance(value, numbers.Integral)
+
+
 class CardFactory:
     def __init__(
         self,
@@ -26,8 +38,17 @@ class CardFactory:
         if not isinstance(level_cap_bonuses, dict):
             raise TypeError("Level cap bonuses data must be a dictionary.")
 
-        self._level_cap_map: Dict = level_caps
-        self._level_cap_bonus_map: Dict = level_cap_bonuses
+        # Flattened so each card resolves its cap and bonus with a single lookup.
+        self._level_cap_map: Dict[Tuple[str, str], int] = {
+            (rarity, status): cap
+            for rarity, caps in level_caps.items()
+            for status, cap in caps.items()
+        }
+        self._level_cap_bonus_map: Dict[Tuple[str, int], int] = {
+            (bonus_type, int(level)): bonus
+            for bonus_type, bonuses in level_cap_bonuses.items()
+            for level, bonus in bonuses.items()
+        }
         self._card_data_map: Dict[int, CardData] = self._index_card_data(raw_card_data)
 
     def _load_json(self, json_path: str) -> Union[Dict, List]:
@@ -42,25 +63,25 @@ class CardFactory:
     def _index_card_data(self, raw_data: List[Dict]) -> Dict[int, CardData]:
         """Converts raw list of dicts into a map of CardData objects, keyed by card_id."""
         indexed_map = {}
+        get = dict.get
         for record in raw_data:
-            card_id = record.get("card_id")
+            card_id = get(record, "card_id")
             if not card_id or not isinstance(card_id, int):
                 continue
 
             data_instance = CardData(
                 card_id=int(card_id),
-                display_name=str(record.get("display_name", "Unknown")),
-                rarity=str(record.get("rarity", "N")),
-                attribute=str(record.get("attribute", "All")),
-                character=str(record.get("character", "Unknown")),
-                is_promo=str(record.get("is_promo", "false")).lower() == "true",
-                is_preidolized_non_promo=str(
-                    record.get("is_preidolized_non_promo", "false")
-                ).lower()
-                == "true",
-                stats=record.get("stats", {}),
-                skill=record.get("skill", {}),
-                leader_skill=record.get("leader_skill", {}),
+                display_name=str(get(record, "display_name", "Unknown")),
+                rarity=str(get(record, "rarity", "N")),
+                attribute=str(get(record, "attribute", "All")),
+                character=str(get(record, "character", "Unknown")),
+                is_promo=_parse_bool(get(record, "is_promo", False)),
+                is_preidolized_non_promo=_parse_bool(
+                    get(record, "is_preidolized_non_promo", False)
+                ),
+                stats=get(record, "stats", {}),
+                skill=get(record, "skill", {}),
+                leader_skill=get(record, "leader_skill", {}),
             )
             indexed_map[data_instance.card_id] = data_instance
         return indexed_map
@@ -70,19 +91,19 @@ class CardFactory:
     ) -> Tuple[int, Optional[int], Optional[int]]:
         """Validates input types, warns on failure, and returns sanitized values."""
 
-        if not isinstance(skill_level, numbers.Integral):
+        if not _is_integral(skill_level):
             warnings.warn(
                 f"Invalid type for skill_level: got {type(skill_level).__name__}, expected int. Defaulting to 1."
             )
             skill_level = 1
 
-        if level is not None and not isinstance(level, numbers.Integral):
+        if level is not None and not _is_integral(level):
             warnings.warn(
                 f"Invalid type for level: got {type(level).__name__}, expected int. Ignoring custom level."
             )
             level = None
 
-        if sis_slots is not None and not isinstance(sis_slots, numbers.Integral):
+        if sis_slots is not None and not _is_integral(sis_slots):
             warnings.warn(
                 f"Invalid type for sis_slots: got {type(sis_slots).__name__}, expected int. Ignoring custom SIS slots."
             )
@@ -128,7 +149,56 @@ class CardFactory:
         skill_level, level, sis_slots = self._validate_and_sanitize_inputs(
             skill_level, level, sis_slots
         )
+        return self._create_card_unchecked(
+            card_id, gallery, idolized, skill_level, level, sis_slots
+        )
+
+    def create_cards_bulk(
+        self, specs: Iterable[Tuple[int, Dict[str, Any]]], gallery: Gallery
+    ) -> List[Optional[Card]]:
+        """
+        Creates several cards sharing one gallery, e.g. when loading a deck.
+
+        Each spec is a `(card_id, config)` pair, where `config` holds the same
+        optional settings as `create_card`. Inputs are validated exactly as in
+        `create_card`; the result has one entry per spec, None where creation
+        failed.
+        """
+        validate = self._validate_and_sanitize_inputs
+        create = self._create_card_unchecked
+        cards: List[Optional[Card]] = []
+        for card_id, config in specs:
+            get = config.get
+            skill_level, level, sis_slots = validate(
+                get("skill_level", 1), get("level"), get("sis_slots")
+            )
+            cards.append(
+                create(
+                    card_id,
+                    gallery,
+                    get("idolized", False),
+                    skill_level,
+                    level,
+                    sis_slots,
+                )
+            )
+        return cards
+
+    def _create_card_unchecked(
+        self,
+        card_id: int,
+        gallery: Gallery,
+        idolized: bool,
+        skill_level: int,
+        level: Optional[int],
+        sis_slots: Optional[int],
+    ) -> Optional[Card]:
+        """
+        Creates a configured Card without type-checking the inputs.
 
+        Internal method for callers whose values already come from an existing
+        Card, such as the parent Deck re-creating its cards.
+        """
         card_data = self._card_data_map.get(card_id)
         if not card_data:
             return None
@@ -58,17 +58,13 @@ class Deck:
 
         for entry in self._entries.values():
             current_card = entry.card
-            current_config = {
-                "idolized": current_card.idolized_status == "idolized",
-                "level": current_card.level,
-                "skill_level": current_card.current_skill_level,
-                "sis_slots": current_card.current_sis_slots,
-            }
-
-            new_card = self._card_factory.create_card(
-                card_id=current_card.card_id,
-                gallery=self._gallery,
-                **current_config,
+            new_card = self._card_factory._create_card_unchecked(
+                current_card.card_id,
+                self._gallery,
+                current_card.idolized_status == "idolized",
+                current_card.current_skill_level,
+                current_card.level,
+                current_card.current_sis_slots,
             )
 
             if new_card:
@@ -124,6 +120,9 @@ class Deck:
 
         current_card = entry.card
 
+        if self._modify_card_in_place(current_card, kwargs):
+            return True
+
         current_config = {
             "idolized": current_card.idolized_status == "idolized",
             "level": current_card.level,
@@ -146,13 +145,38 @@ class Deck:
         entry.card = new_card
         return True
 
+    @staticmethod
+    def _modify_card_in_place(card: Card, changes: Dict[str, Any]) -> bool:
+        """
+        Applies skill level and SIS slot changes directly to an existing card.
+
+        Returns False without touching the card if the changes need a full
+        re-creation (any other attribute, or a value the card's setters would
+        reject), so the factory's usual warn-and-default handling applies.
+        """
+        if not changes or not changes.keys() <= {"skill_level", "sis_slots"}:
+            return False
+        if not all(isinstance(value, int) for value in changes.values()):
+            return False
+
+        skill_level = changes.get("skill_level", card.current_skill_level)
+        sis_slots = changes.get("sis_slots", card.current_sis_slots)
+        stats = card.stats
+        if not (1 <= skill_level <= 8 and stats.sis_base <= sis_slots <= stats.sis_max):
+            return False
+
+        card.current_skill_level = skill_level
+        card.current_sis_slots = sis_slots
+        return True
+
     def get_unassigned_cards(self, assigned_deck_ids: set[int]) -> List[Card]:
-        """Returns a list of Card objects not in the provided set of assigned IDs."""
-        return [
-            entry.card
-            for deck_id, entry in self._entries.items()
-            if deck_id not in assigned_deck_ids
-        ]
+        """
+        Returns a list of Card objects not in the provided set of assigned IDs,
+        ordered by deck_id.
+        """
+        entries = self._entries
+        unassigned_ids = entries.keys() - assigned_deck_ids
+        return [entries[deck_id].card for deck_id in sorted(unassigned_ids)]
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializes the deck to a dictionary for JSON conversion."""
@@ -180,8 +204,13 @@ class Deck:
             dir_name = os.path.dirname(filepath)
             if dir_name:
                 os.makedirs(dir_name, exist_ok=True)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=4)
+            # Serialize up front so the file is written in one go, then swap
+            # it in so a failed save never leaves a half-written file behind.
+            payload = json.dumps(self.to_dict(), indent=4).encode("utf-8")
+            tmp_path = f"{filepath}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
             return True
         except (IOError, TypeError) as e:
             warnings.warn(f"Could not save deck to {filepath}: {e}")
@@ -194,21 +223,24 @@ class Deck:
             return False
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
+            with open(filepath, "rb") as f:
                 data = json.load(f)
 
             gallery_data = data.get("gallery", {})
             self._gallery = Gallery.from_dict(gallery_data)
 
+            entries_data = data.get("entries", [])
+            cards = self._card_factory.create_cards_bulk(
+                (
+                    (entry_data.get("card_id"), entry_data.get("config", {}))
+                    for entry_data in entries_data
+                ),
+                self.gallery,
+            )
+
             new_entries = {}
-            for entry_data in data.get("entries", []):
+            for entry_data, card in zip(entries_data, cards):
                 card_id = entry_data.get("card_id")
-                config = entry_data.get("config", {})
-
-                card = self._card_factory.create_card(
-                    card_id, gallery=self.gallery, **config
-                )
-
                 if card:
                     deck_id = entry_data["deck_id"]
                     new_entries[deck_id] = DeckEntry(deck_id=deck_id, card=card)
@@ -242,16 +274,13 @@ class Deck:
 
         new_entries = {}
         for deck_id, entry in self._entries.items():
-            card_config = {
-                "idolized": entry.card.idolized_status == "idolized",
-                "level": entry.card.level,
-                "skill_level": entry.card.current_skill_level,
-                "sis_slots": entry.card.current_sis_slots,
-            }
-            new_card = self._card_factory.create_card(
-                card_id=entry.card.card_id,
-                gallery=new_deck.gallery,
-                **card_config
+            new_card = self._card_factory._create_card_unchecked(
+                entry.card.card_id,
+                new_deck.gallery,
+                entry.card.idolized_status == "idolized",
+                entry.card.current_skill_level,
+                entry.card.level,
+                entry.card.current_sis_slots,
             )
             if new_card:
                 new_entries[deck_id] = DeckEntry(deck_id=deck_id, card=new_card)
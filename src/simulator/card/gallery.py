@@ -2,7 +2,7 @@ from dataclasses import dataclass, asdict
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Gallery:
     """Holds the gallery stat bonuses for a deck."""
 
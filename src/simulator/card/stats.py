@@ -12,3 +12,14 @@ class Stats:
     sis_base: int = 1
     sis_max: int = 1
     image: Optional[str] = None
+
+    def with_bonus(self, bonus: int) -> "Stats":
+        """Returns a copy with `bonus` added to each of smile, pure and cool."""
+        return Stats(
+            self.smile + bonus,
+            self.pure + bonus,
+            self.cool + bonus,
+            self.sis_base,
+            self.sis_max,
+            self.image,
+        )
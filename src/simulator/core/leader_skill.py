@@ -1,8 +1,9 @@
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LeaderSkill:
     """Represents the details of a card's leader skill, including any extra components."""
 
@@ -12,3 +13,11 @@ class LeaderSkill:
     extra_attribute: Optional[str] = None
     extra_target: Optional[str] = None
     extra_value: float = 0.0
+
+    def __post_init__(self):
+        # Interned like Skill's names, so attribute checks against "Smile",
+        # "Pure" and "Cool" in the team stat calculation match on identity.
+        for name in ("attribute", "secondary_attribute", "extra_attribute"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Union
 
@@ -14,3 +15,11 @@ class Skill:
     chances: List[float] = field(default_factory=list)
     values: List[Union[int, float]] = field(default_factory=list)
     durations: List[Union[int, float]] = field(default_factory=list)
+
+    def __post_init__(self):
+        # Interned so the simulator's checks against literal type and activation
+        # names, and lookups keyed by them, can match on identity.
+        for name in ("type", "activation"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
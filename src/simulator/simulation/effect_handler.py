@@ -30,40 +30,22 @@ def recalculate_stats_and_ppn(state: "TrialState", play: "Play"):
     This is a core function called whenever a stat-modifying effect
     starts or ends.
     """
-    original_slot_stats = [
-        {"smile": s.total_smile, "pure": s.total_pure, "cool": s.total_cool}
-        for s in play.team.slots
-    ]
-    current_stats = [dict(s) for s in original_slot_stats]
+    current_stats = play.base_slot_stats.copy()
 
     if state.active_appeal_boost:
         boost_val = state.active_appeal_boost["value"]
-        for target_idx in state.active_appeal_boost["target_slots"]:
-            for attr in ["smile", "pure", "cool"]:
-                current_stats[target_idx][attr] = math.ceil(
-                    current_stats[target_idx][attr] * (1 + boost_val)
-                )
+        targets = list(state.active_appeal_boost["target_slots"])
+        current_stats[targets] = np.ceil(current_stats[targets] * (1 + boost_val))
 
     for slot_idx, sync_info in state.active_sync_effects.items():
-        target_sync_idx = sync_info["target_slot_index"]
-        current_stats[slot_idx] = dict(current_stats[target_sync_idx])
-
-    is_trick_active = state.active_pl_count > 0
-    if is_trick_active:
-        for slot_idx, tricks in play.trick_slots.items():
-            for trick_sis in tricks:
-                attr = trick_sis.attribute.lower()
-                bonus = math.ceil(original_slot_stats[slot_idx][attr] * trick_sis.value)
-                current_stats[slot_idx][attr] += bonus
-
-    final_team_stats = {
-        "Smile": sum(s.get("smile", 0) for s in current_stats),
-        "Pure": sum(s.get("pure", 0) for s in current_stats),
-        "Cool": sum(s.get("cool", 0) for s in current_stats),
-    }
-    state.current_slot_ppn = play.calculate_ppn_for_all_slots(
-        final_team_stats.get(play.song.attribute, 0)
-    )
+        current_stats[slot_idx] = current_stats[sync_info["target_slot_index"]]
+
+    if state.active_pl_count > 0:
+        current_stats += play.trick_stat_bonuses
+
+    col = play.song_stat_column
+    team_total_stat = int(current_stats[:, col].sum()) if col is not None else 0
+    state.current_slot_ppn = play.calculate_ppn_for_all_slots(team_total_stat)
 
 
 def apply_score_effect(
@@ -132,6 +114,7 @@ def apply_perfect_lock_effect(
         state.pl_uptime_start_time = current_time
 
     state.active_pl_count += 1
+    state.lock_active_until = math.inf
     end_time = min(current_time + duration, song_end_time)
 
     heapq.heappush(
@@ -150,6 +133,8 @@ def end_perfect_lock_effect(
     Handles the logic for when a Perfect Lock effect expires.
     """
     state.active_pl_count -= 1
+    if state.active_pl_count == 0:
+        state.lock_active_until = state.total_trick_end_time
     if state.active_pl_count == 0 and state.pl_uptime_start_time is not None:
         interval = (
             state.pl_uptime_start_time,
@@ -179,13 +164,15 @@ def apply_total_trick_effect(
         state.total_trick_end_time,
         min(current_time + duration, song_end_time),
     )
+    if state.active_pl_count == 0:
+        state.lock_active_until = state.total_trick_end_time
     return duration
 
 
 def apply_generic_timed_effect(
     state_effects_dict: Dict[uuid.UUID, Any],
     event_queue: List[Event],
-    event_type: EventType,
+    event_type: int,
     current_time: float,
     duration: float,
     value: Any,
@@ -197,13 +184,24 @@ def apply_generic_timed_effect(
     effect_id = uuid.uuid4()
     end_time = min(current_time + duration, song_end_time)
 
-    state_effects_dict[effect_id] = {"value": value}
+    state_effects_dict[effect_id] = value
 
     heapq.heappush(event_queue, Event(end_time, event_type, payload={"id": effect_id}))
 
     return effect_id
 
 
+def refresh_bonus_totals(state: "TrialState"):
+    """
+    Re-sums the active PSU and Spark values into the state's running totals.
+
+    Effects start and end far less often than notes are scored, so the sums
+    are kept up to date here instead of being recomputed for every note.
+    """
+    state.psu_bonus_total = sum(state.active_psu_effects.values())
+    state.spark_bonus_total = sum(state.active_spark_effects.values())
+
+
 def end_generic_timed_effect(
     state_effects_dict: Dict[uuid.UUID, Any], effect_id: uuid.UUID | None
 ) -> bool:
@@ -433,4 +431,5 @@ def apply_spark_effect(
         bonus_per_note,
         song_end_time,
     )
+    refresh_bonus_totals(state)
     return True, charges_to_consume, bonus_per_note, duration
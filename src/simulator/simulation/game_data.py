@@ -33,12 +33,20 @@ class GameData:
                                                      thresholds and their
                                                      corresponding score
                                                      multipliers.
+        combo_bonus_thresholds (List[int]): The combo_bonus_tiers thresholds
+                                            in ascending order, for bisecting.
+        combo_bonus_multipliers (List[float]): The multiplier for each entry
+                                               of combo_bonus_thresholds.
         note_speed_map (Dict[int, float]): Maps approach rate (1-10) to the
                                            on-screen duration of a note.
         combo_fever_map (List[Tuple[int, float]]): A sorted list of combo
                                                    thresholds for the Combo
                                                    Fever skill and their
                                                    score multipliers.
+        combo_fever_thresholds (List[int]): The combo_fever_map thresholds in
+                                            ascending order, for bisecting.
+        combo_fever_multipliers (List[float]): The multiplier for each entry
+                                               of combo_fever_thresholds.
     """
 
     HEAL_MULTIPLIER = 480
@@ -66,12 +74,18 @@ class GameData:
         self.combo_bonus_tiers = self._load_combo_bonuses(
             os.path.join(data_path, "combo_bonuses.json")
         )
+        ascending_bonus_tiers = self.combo_bonus_tiers[::-1]
+        self.combo_bonus_thresholds = [t for t, _ in ascending_bonus_tiers]
+        self.combo_bonus_multipliers = [m for _, m in ascending_bonus_tiers]
         self.note_speed_map = self._load_note_speed_map(
             os.path.join(data_path, "note_speed_map.json")
         )
         self.combo_fever_map = self._load_combo_fever_map(
             os.path.join(data_path, "combo_fever_map.json")
         )
+        ascending_fever_map = self.combo_fever_map[::-1]
+        self.combo_fever_thresholds = [t for t, _ in ascending_fever_map]
+        self.combo_fever_multipliers = [m for _, m in ascending_fever_map]
 
     def _load_json_mapping(self, filepath: str, name: str) -> Dict[str, Set[str]]:
         """
@@ -5,19 +5,27 @@ of a team playing a song.
 
 # pylint: disable=too-few-public-methods
 
+import bisect
 import logging
+import logging.handlers
 import time
 import math
 import warnings
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from src.simulator.card.card import Card
+from src.simulator.simulation.events import (
+    Event,
+    EventType,
+    NoteSpawnPayload,
+)
 from src.simulator.simulation.game_data import GameData
 from src.simulator.simulation.play_config import PlayConfig
 from src.simulator.simulation.trial import Trial
+from src.simulator.simulation.trial_state import HOLD_START_UNSET
 from src.simulator.sis.sis import SIS
 from src.simulator.song.note import Note
 from src.simulator.song.song import Song
@@ -44,6 +52,15 @@ class Play:
         "default": 1.0,
     }
 
+    # Column order of the per-slot stat arrays.
+    STAT_COLUMNS = ("smile", "pure", "cool")
+
+    # Log records held in memory before they are written to the log file.
+    LOG_BUFFER_CAPACITY = 10_000
+
+    # Skill activations that only fire on reaching a threshold.
+    THRESHOLD_ACTIVATIONS = frozenset({"Rhythm Icons", "Perfects", "Combo", "Score"})
+
     def __init__(self, team: Team, song: Song, config: PlayConfig, game_data: GameData):
         """
         Initializes a new play instance.
@@ -68,12 +85,86 @@ class Play:
             if slot.card
         }
 
+        # Per-slot (smile, pure, cool) stats, and the flat bonus the team's
+        # trick SIS add to them while a Perfect Lock is active.
+        self.base_slot_stats: np.ndarray = np.array(
+            [[s.total_smile, s.total_pure, s.total_cool] for s in self.team.slots],
+            dtype=np.int64,
+        )
+        self.trick_stat_bonuses: np.ndarray = self._calculate_trick_stat_bonuses()
+        song_attribute = self.song.attribute.lower()
+        self.song_stat_column: Optional[int] = (
+            self.STAT_COLUMNS.index(song_attribute)
+            if song_attribute in self.STAT_COLUMNS
+            else None
+        )
+
+        # Each slot's group and attribute bonus multiplier, or None if it is
+        # empty. PPN lists are cached by team total stat; they are never mutated.
+        self.slot_ppn_bonuses: List[Optional[float]] = [
+            (
+                1
+                + self._check_group_bonus(slot.card)
+                + self._check_attribute_bonus(slot.card)
+                if slot.card
+                else None
+            )
+            for slot in self.team.slots
+        ]
+        self._ppn_cache: Dict[int, List[int]] = {}
+
         team_total_stat = getattr(
             self.team, f"total_team_{self.song.attribute.lower()}", 0
         )
+        if team_total_stat == 0:
+            warnings.warn("Team total stat for song attribute is 0. All PPN will be 0.")
         self.base_slot_ppn: List[int] = self.calculate_ppn_for_all_slots(
             team_total_stat
         )
+        # Per-note properties read when each note is scored, indexed by note_idx.
+        notes = self.song.notes
+        num_slots = len(self.team.slots)
+        self.note_multipliers: List[float] = [
+            self.get_note_multiplier(note) for note in notes
+        ]
+        self.note_is_hold: List[bool] = [
+            note.start_time != note.end_time for note in notes
+        ]
+        self.note_is_star: List[bool] = [note.is_star for note in notes]
+        # The team slot a note is hit by, or None if its position has no slot.
+        self.note_slot_indices: List[Optional[int]] = [
+            note.position - 1 if 1 <= note.position <= num_slots else None
+            for note in notes
+        ]
+        self.note_type_names: List[str] = [
+            self.get_note_type_name(note) for note in notes
+        ]
+        # Indexed by combo count; one spare entry covers the final note.
+        max_combo = len(self.song.notes) + 1
+        self.combo_multipliers: List[float] = [
+            self.get_combo_multiplier(combo, game_data) for combo in range(max_combo)
+        ]
+        self.combo_fever_multipliers: List[float] = [
+            self.get_combo_fever_multiplier(combo, game_data)
+            for combo in range(max_combo)
+        ]
+        self.activation_index: Dict[str, List[Tuple[int, Card, Optional[int]]]] = (
+            self._build_activation_index()
+        )
+        # One bit per character that can be part of a skill target subgroup, so
+        # Year Group trackers can hold the members they wait on as an int mask.
+        self.character_bits: Dict[str, int] = {
+            character: 1 << bit
+            for bit, character in enumerate(
+                sorted(set().union(*game_data.sub_group_mapping.values()))
+            )
+        }
+
+        # The song's events are the same for every trial, so they are built and
+        # sorted once; trials merge them with the events their skills schedule.
+        self.scheduled_events: List[Event]
+        self.song_end_time: float
+        self.scheduled_events, self.song_end_time = self._build_scheduled_events()
 
     def simulate(self, n_trials: int = 1, log_level: Optional[int] = None) -> List[int]:
         """
@@ -94,11 +185,14 @@ class Play:
         trial_scores: List[int] = []
         trial_uptimes: List[float] = []
 
+        # Checked once so per-trial messages are not formatted when discarded.
+        debug_on = self.logger.isEnabledFor(logging.DEBUG)
         self.logger.debug("--- Starting Simulation for %s ---", self)
         for i in range(n_trials):
-            self.logger.debug(
-                "--- Starting Simulation Trial %d/%d ---", i + 1, n_trials
-            )
+            if debug_on:
+                self.logger.debug(
+                    "--- Starting Simulation Trial %d/%d ---", i + 1, n_trials
+                )
 
             trial = Trial(self, self.random_state)
             trial.run()
@@ -106,19 +200,146 @@ class Play:
             trial_scores.append(trial.total_score)
             total_uptime = trial.get_total_pl_uptime()
             trial_uptimes.append(total_uptime)
-            self._log_trial_summary(trial, total_uptime)
-
-            self.logger.debug(
-                "--- Trial %d Finished. Final Score: %s ---",
-                i + 1,
-                f"{trial.total_score:,}",
-            )
+            if debug_on:
+                self._log_trial_summary(trial, total_uptime)
+                self.logger.debug(
+                    "--- Trial %d Finished. Final Score: %s ---",
+                    i + 1,
+                    f"{trial.total_score:,}",
+                )
 
         if n_trials > 1:
             self._log_overall_summary(trial_scores, trial_uptimes)
+        for handler in self.logger.handlers:
+            handler.flush()
 
         return trial_scores
 
+    def _calculate_trick_stat_bonuses(self) -> np.ndarray:
+        """Sums the stat bonus each slot's trick SIS grant during Perfect Lock."""
+        bonuses = np.zeros_like(self.base_slot_stats)
+        for slot_idx, tricks in self.trick_slots.items():
+            for trick_sis in tricks:
+                col = self.STAT_COLUMNS.index(trick_sis.attribute.lower())
+                base_stat = int(self.base_slot_stats[slot_idx, col])
+                bonuses[slot_idx, col] += math.ceil(base_stat * trick_sis.value)
+        return bonuses
+
+    def _build_activation_index(
+        self,
+    ) -> Dict[str, List[Tuple[int, Card, Optional[int]]]]:
+        """
+        Groups the team's cards by skill activation type, in slot order.
+
+        Each entry is `(slot_idx, card, skill_threshold)`. Cards whose skill
+        needs a threshold but has none can never trigger, so they are left out.
+        """
+        index: Dict[str, List[Tuple[int, Card, Optional[int]]]] = {}
+        for idx, slot in enumerate(self.team.slots):
+            card = slot.card
+            if not card:
+                continue
+            activation = card.skill.activation
+            threshold = card.skill_threshold
+            if activation in self.THRESHOLD_ACTIVATIONS and not threshold:
+                continue
+            index.setdefault(activation, []).append((idx, card, threshold))
+        return index
+
+    def year_group_mask(self, card: Card) -> int:
+        """
+        Returns the bitmask of the members a Year Group card waits on.
+
+        These are the card's target subgroup, minus the card's own character.
+        """
+        members = self.game_data.sub_group_mapping.get(card.skill.target, ())
+        mask = 0
+        for character in members:
+            if character != card.character:
+                mask |= self.character_bits[character]
+        return mask
+
+    def _build_scheduled_events(self) -> Tuple[List[Event], float]:
+        """
+        Creates the time-ordered list of the song's events for every trial.
+
+        Events at the same time and priority keep the order they are created
+        in, so simultaneous notes are always processed in note order.
+
+        Note spawns only drive Rhythm Icons skills, so they are left out when
+        the team has none, unless logging is enabled and they are logged.
+        """
+        events: List[Event] = []
+        on_screen_duration = self.game_data.note_speed_map.get(
+            self.config.approach_rate, 1.0
+        )
+        schedule_spawns = (
+            "Rhythm Icons" in self.activation_index or self.config.enable_logging
+        )
+
+        last_note_completion_time = 0.0
+        if self.song.notes:
+            last_note_completion_time = max(note.end_time for note in self.song.notes)
+
+        for i, note in enumerate(self.song.notes):
+            # Note spawn events
+            if schedule_spawns:
+                events.append(
+                    Event(
+                        time=note.start_time - on_screen_duration,
+                        priority=EventType.NOTE_SPAWN,
+                        payload=NoteSpawnPayload(i, "start"),
+                    )
+                )
+            if self.note_is_hold[i]:
+                if schedule_spawns:
+                    events.append(
+                        Event(
+                            time=note.end_time - on_screen_duration,
+                            priority=EventType.NOTE_SPAWN,
+                            payload=NoteSpawnPayload(i, "end"),
+                        )
+                    )
+                events.append(
+                    Event(
+                        time=note.start_time,
+                        priority=EventType.NOTE_START,
+                        payload=i,
+                    )
+                )
+
+            # Note completion event
+            events.append(
+                Event(
+                    time=note.end_time,
+                    priority=EventType.NOTE_COMPLETION,
+                    payload=i,
+                )
+            )
+
+        # Song end event
+        song_end_time = last_note_completion_time + 0.001
+        events.append(Event(song_end_time, EventType.SONG_END))
+
+        # Time-based skill events
+        for slot_idx, card, threshold in self.activation_index.get("Time", ()):
+            if threshold and threshold > 0:
+                # Every multiple of the threshold before the song's length,
+                # computed as np.arange(threshold, length, threshold) would.
+                num_ticks = math.ceil((self.song.length - threshold) / threshold)
+                for tick in range(num_ticks):
+                    payload = {"card": card, "slot_idx": slot_idx}
+                    events.append(
+                        Event(
+                            threshold + tick * threshold,
+                            EventType.TIME_SKILL,
+                            payload=payload,
+                        )
+                    )
+
+        events.sort(key=lambda event: (event.time, event.priority))
+        return events, song_end_time
+
     # --- PPN and Multiplier Calculation Helpers ---
 
     def _check_group_bonus(self, card: Card) -> float:
@@ -132,23 +353,28 @@ class Play:
         return self.ATTRIBUTE_BONUS if self.song.attribute == card.attribute else 0.0
 
     def calculate_ppn_for_all_slots(self, team_total_stat: int) -> List[int]:
-        """Calculates the PPN for each team slot given a total team stat."""
+        """
+        Calculates the PPN for each team slot given a total team stat.
+
+        This is re-run whenever a skill changes team stats mid-trial, so it
+        does not warn; a zero base stat is reported once when the Play is built.
+        """
         if team_total_stat == 0:
-            warnings.warn("Team total stat for song attribute is 0. All PPN will be 0.")
             return [0] * self.team.NUM_SLOTS
 
-        ppn_values = []
-        for slot in self.team.slots:
-            if not slot.card:
-                ppn_values.append(0)
-                continue
-
-            group_bonus = self._check_group_bonus(slot.card)
-            attribute_bonus = self._check_attribute_bonus(slot.card)
+        cached = self._ppn_cache.get(team_total_stat)
+        if cached is not None:
+            return cached
 
-            total_bonus = 1 + group_bonus + attribute_bonus
-            slot_ppn = math.floor(team_total_stat * self.PPN_BASE_FACTOR * total_bonus)
-            ppn_values.append(slot_ppn)
+        ppn_values = [
+            (
+                math.floor(team_total_stat * self.PPN_BASE_FACTOR * total_bonus)
+                if total_bonus is not None
+                else 0
+            )
+            for total_bonus in self.slot_ppn_bonuses
+        ]
+        self._ppn_cache[team_total_stat] = ppn_values
         return ppn_values
 
     @staticmethod
@@ -162,24 +388,51 @@ class Play:
         if note.is_swing:
             return Play.NOTE_MULTIPLIERS["is_swing"]
         return Play.NOTE_MULTIPLIERS["default"]
-    
+
+    @staticmethod
+    def get_note_type_name(note: Note) -> str:
+        """Describes a note's type for the simulation log."""
+        is_hold = note.start_time != note.end_time
+        if is_hold and note.is_swing:
+            return "swing hold"
+        if is_hold:
+            return "hold"
+        if note.is_swing:
+            return "swing"
+        return "regular"
+
     @staticmethod
     def get_combo_multiplier(combo_count: int, game_data: GameData) -> float:
         """Finds the combo multiplier for the current combo count."""
-        for threshold, multiplier in game_data.combo_bonus_tiers:
-            if combo_count + 1 >= threshold:
-                return multiplier
-        return 1.0  # Default if no tier is met
+        tier = bisect.bisect_right(game_data.combo_bonus_thresholds, combo_count + 1)
+        return game_data.combo_bonus_multipliers[tier - 1] if tier else 1.0
+
+    @staticmethod
+    def get_combo_fever_multiplier(combo_count: int, game_data: GameData) -> float:
+        """Finds the Combo Bonus Up multiplier for the current combo count."""
+        tier = bisect.bisect_right(game_data.combo_fever_thresholds, combo_count + 1)
+        return game_data.combo_fever_multipliers[tier - 1] if tier else 1.0
 
     # --- Logging and Output ---
 
     def _setup_logger(self, log_level: int) -> logging.Logger:
-        """Configures a logger to write simulation results to a file."""
-        logger = logging.getLogger("simulation_logger")
+        """
+        Configures a logger to write simulation results to a file.
 
-        if not self.config.enable_logging:
-            if logger.hasHandlers():
-                logger.handlers.clear()
+        The simulation only logs at INFO and DEBUG, so no log file is created
+        when logging is disabled or `log_level` is above INFO.
+        """
+        logger = logging.getLogger("simulation_logger")
+        # Close rather than just drop the previous run's handlers, so their
+        # log files are flushed and not left open.
+        for handler in list(logger.handlers):
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target:
+                target.close()
+            logger.removeHandler(handler)
+
+        if not self.config.enable_logging or log_level > logging.INFO:
             logger.addHandler(logging.NullHandler())
             logger.setLevel(logging.CRITICAL + 1)
             return logger
@@ -200,24 +453,30 @@ class Play:
         logger.setLevel(log_level)
         logger.propagate = False
 
-        if logger.hasHandlers():
-            logger.handlers.clear()
-
         file_handler = logging.FileHandler(log_filepath, encoding="utf-8")
         file_handler.setFormatter(logging.Formatter("%(message)s"))
-        logger.addHandler(file_handler)
+        # A trial logs a line per note and skill, so records are buffered and
+        # written in batches; simulate() flushes what is left when it finishes.
+        logger.addHandler(
+            logging.handlers.MemoryHandler(
+                self.LOG_BUFFER_CAPACITY, target=file_handler
+            )
+        )
 
         return logger
 
     def _log_trial_summary(self, trial: Trial, total_uptime: float):
         """Logs the summary of a single completed trial."""
-        if not self.logger:
+        if not self.logger or not self.logger.isEnabledFor(logging.DEBUG):
             return
 
         self.logger.debug("--- Trial Summary ---")
         self.logger.debug("Final Score: %s", f"{trial.total_score:,}")
 
-        hold_starts = len(trial.hold_note_start_results)
+        hold_start_results = trial.hold_note_start_results
+        hold_starts = len(hold_start_results) - hold_start_results.count(
+            HOLD_START_UNSET
+        )
         total_judgements = trial.notes_hit + hold_starts
 
         ratio_percent = (
@@ -239,7 +498,7 @@ class Play:
 
     def _log_overall_summary(self, scores: List[int], uptimes: List[float]):
         """Logs the summary of all completed trials."""
-        if not self.logger:
+        if not self.logger or not self.logger.isEnabledFor(logging.DEBUG):
             return
 
         self.logger.debug("\n--- Overall Simulation Summary ---")
@@ -31,6 +31,7 @@ class SkillActivationHandler:
     def __init__(self, random_state: np.random.Generator, logger: logging.Logger):
         self.random_state = random_state
         self.logger = logger
+        self._info_on = logger.isEnabledFor(logging.INFO)
         self.amp_consumed_this_tick = False
 
     def _check_score_triggers(
@@ -42,16 +43,10 @@ class SkillActivationHandler:
     ):
         """Processes skills activated by reaching a score threshold."""
         triggered = []
-        for idx, slot in enumerate(play.team.slots):
-            card = slot.card
-            if not (card and card.skill.activation == "Score" and card.skill_threshold):
-                continue
-
-            next_thresh = state.score_skill_trackers.get(idx, card.skill_threshold)
-
+        for idx, card, threshold in play.activation_index.get("Score", ()):
+            next_thresh = state.score_skill_trackers.get(idx, threshold)
             if state.total_score >= next_thresh:
-                if card.skill_threshold:
-                    state.score_skill_trackers[idx] = next_thresh + card.skill_threshold
+                state.score_skill_trackers[idx] = next_thresh + threshold
                 triggered.append({"card": card, "slot_idx": idx})
 
         if triggered:
@@ -138,18 +133,20 @@ class SkillActivationHandler:
 
         accessory = play.team.slots[slot_idx].accessory
         if not accessory:
+            if self._info_on:
+                self.logger.info(
+                    "SKILL: (%d) %s's skill failed. No accessory to attempt.",
+                    slot_idx + 1,
+                    card.display_name,
+                )
+            return
+
+        if self._info_on:
             self.logger.info(
-                "SKILL: (%d) %s's skill failed. No accessory to attempt.",
+                "SKILL: (%d) %s's skill failed. Checking for accessory skill...",
                 slot_idx + 1,
                 card.display_name,
             )
-            return
-
-        self.logger.info(
-            "SKILL: (%d) %s's skill failed. Checking for accessory skill...",
-            slot_idx + 1,
-            card.display_name,
-        )
         acc_activated, amp_used = self._check_rng_and_activate(
             accessory,
             slot_idx,
@@ -164,12 +161,13 @@ class SkillActivationHandler:
         if acc_activated and amp_used:
             self.amp_consumed_this_tick = True
         elif not acc_activated:
-            self.logger.info(
-                "SKILL: Accessory %s on (%d) %s also failed to activate.",
-                accessory.name,
-                slot_idx + 1,
-                card.display_name,
-            )
+            if self._info_on:
+                self.logger.info(
+                    "SKILL: Accessory %s on (%d) %s also failed to activate.",
+                    accessory.name,
+                    slot_idx + 1,
+                    card.display_name,
+                )
 
     def _check_rng_and_activate(
         self,
@@ -258,13 +256,14 @@ class SkillActivationHandler:
                     play.game_data,
                     eff_lvl,
                 )
-                self.logger.info(
-                    "SKILL: (%d) %s's %s activated for %d points.",
-                    slot_idx + 1,
-                    item_name,
-                    skill_type,
-                    score,
-                )
+                if self._info_on:
+                    self.logger.info(
+                        "SKILL: (%d) %s's %s activated for %d points.",
+                        slot_idx + 1,
+                        item_name,
+                        skill_type,
+                        score,
+                    )
                 state.last_skill_info = {
                     "item": skilled_item,
                     "slot_index": slot_idx,
@@ -285,12 +284,13 @@ class SkillActivationHandler:
                     eff_lvl,
                     play,
                 )
-                self.logger.info(
-                    "SKILL: (%d) %s's Perfect Lock activated for %.2f seconds.",
-                    slot_idx + 1,
-                    item_name,
-                    duration,
-                )
+                if self._info_on:
+                    self.logger.info(
+                        "SKILL: (%d) %s's Perfect Lock activated for %.2f seconds.",
+                        slot_idx + 1,
+                        item_name,
+                        duration,
+                    )
                 state.last_skill_info = {
                     "item": skilled_item,
                     "slot_index": slot_idx,
@@ -302,12 +302,13 @@ class SkillActivationHandler:
                 duration = effect_handler.apply_total_trick_effect(
                     state, current_time, state.song_end_time, skilled_item, eff_lvl
                 )
-                self.logger.info(
-                    "SKILL: (%d) %s's Total Trick activated for %.2f seconds.",
-                    slot_idx + 1,
-                    item_name,
-                    duration,
-                )
+                if self._info_on:
+                    self.logger.info(
+                        "SKILL: (%d) %s's Total Trick activated for %.2f seconds.",
+                        slot_idx + 1,
+                        item_name,
+                        duration,
+                    )
                 state.last_skill_info = {
                     "item": skilled_item,
                     "slot_index": slot_idx,
@@ -323,12 +324,13 @@ class SkillActivationHandler:
                     or 0
                 )
                 state.active_amp_boost += int(value)
-                self.logger.info(
-                    "SKILL: (%d) %s's Amplify activated, boosting next skill's level by +%d.",
-                    slot_idx + 1,
-                    item_name,
-                    value,
-                )
+                if self._info_on:
+                    self.logger.info(
+                        "SKILL: (%d) %s's Amplify activated, boosting next skill's level by +%d.",
+                        slot_idx + 1,
+                        item_name,
+                        value,
+                    )
                 state.last_skill_info = {
                     "type": "Amplify",
                     "item": skilled_item,
@@ -336,12 +338,13 @@ class SkillActivationHandler:
                 }
             case "Encore":
                 state.spark_charges += 1
-                self.logger.info(
-                    "SKILL: (%d) %s's Encore activated. Spark charges are now %d.",
-                    slot_idx + 1,
-                    item_name,
-                    state.spark_charges,
-                )
+                if self._info_on:
+                    self.logger.info(
+                        "SKILL: (%d) %s's Encore activated. Spark charges are now %d.",
+                        slot_idx + 1,
+                        item_name,
+                        state.spark_charges,
+                    )
                 if state.last_skill_info and state.last_skill_info.get("type") not in [
                     "Encore",
                     "Amplify",
@@ -354,18 +357,19 @@ class SkillActivationHandler:
                         state.last_skill_info,
                         eff_lvl,
                     )
-                else:
+                elif self._info_on:
                     self.logger.info(
                         "-> Encore triggered but had nothing valid to copy."
                     )
                 state.last_skill_info = {"type": "Encore"}
             case "Skill Rate Up":
                 if state.active_sru_effect:
-                    self.logger.info(
-                        f"SKILL: ({slot_idx + 1}) {item_name}'s "
-                        "Skill Rate Up triggered, but another is "
-                        "already active. No effect."
-                    )
+                    if self._info_on:
+                        self.logger.info(
+                            f"SKILL: ({slot_idx + 1}) {item_name}'s "
+                            "Skill Rate Up triggered, but another is "
+                            "already active. No effect."
+                        )
                 else:
                     duration, boost_val = effect_handler.apply_skill_rate_up_effect(
                         state,
@@ -376,20 +380,22 @@ class SkillActivationHandler:
                         event_queue,
                         eff_lvl,
                     )
-                    self.logger.info(
-                        "SKILL: (%d) %s's Skill Rate Up activated, boosting skill chance by %.2f%% for %.2f seconds.",
-                        slot_idx + 1,
-                        item_name,
-                        boost_val * 100,
-                        duration,
-                    )
+                    if self._info_on:
+                        self.logger.info(
+                            "SKILL: (%d) %s's Skill Rate Up activated, boosting skill chance by %.2f%% for %.2f seconds.",
+                            slot_idx + 1,
+                            item_name,
+                            boost_val * 100,
+                            duration,
+                        )
             case "Appeal Boost":
                 if state.active_appeal_boost:
-                    self.logger.info(
-                        f"SKILL: ({slot_idx + 1}) {item_name}'s "
-                        "Appeal Boost triggered, but another is "
-                        "already active. No effect."
-                    )
+                    if self._info_on:
+                        self.logger.info(
+                            f"SKILL: ({slot_idx + 1}) {item_name}'s "
+                            "Appeal Boost triggered, but another is "
+                            "already active. No effect."
+                        )
                 else:
                     duration, boost_val, target_str = (
                         effect_handler.apply_appeal_boost_effect(
@@ -406,14 +412,15 @@ class SkillActivationHandler:
                         )
                     )
                     if target_str:
-                        self.logger.info(
-                            "SKILL: (%d) %s's Appeal Boost activated, increasing stats of %s by %.2f%% for %.2f seconds.",
-                            slot_idx + 1,
-                            item_name,
-                            target_str,
-                            boost_val * 100,
-                            duration,
-                        )
+                        if self._info_on:
+                            self.logger.info(
+                                "SKILL: (%d) %s's Appeal Boost activated, increasing stats of %s by %.2f%% for %.2f seconds.",
+                                slot_idx + 1,
+                                item_name,
+                                target_str,
+                                boost_val * 100,
+                                duration,
+                            )
             case "Sync":
                 duration, target_idx, target_name = effect_handler.apply_sync_effect(
                     state,
@@ -429,14 +436,15 @@ class SkillActivationHandler:
                     eff_lvl,
                 )
                 if target_idx != -1:
-                    self.logger.info(
-                        "SKILL: (%d) %s's Sync copies stats from (%d) %s for %.2f seconds.",
-                        slot_idx + 1,
-                        item_name,
-                        target_idx + 1,
-                        target_name,
-                        duration,
-                    )
+                    if self._info_on:
+                        self.logger.info(
+                            "SKILL: (%d) %s's Sync copies stats from (%d) %s for %.2f seconds.",
+                            slot_idx + 1,
+                            item_name,
+                            target_idx + 1,
+                            target_name,
+                            duration,
+                        )
             case "Perfect Score Up" | "Combo Bonus Up":
                 duration = (
                     skilled_item.get_skill_attribute_for_level(
@@ -476,15 +484,17 @@ class SkillActivationHandler:
                     value,
                     state.song_end_time,
                 )
-                self.logger.info(
-                    "SKILL: (%d) %s's %s activated, adding %d %s for %.2f seconds.",
-                    slot_idx + 1,
-                    item_name,
-                    skill_type,
-                    value,
-                    log_text,
-                    duration,
-                )
+                effect_handler.refresh_bonus_totals(state)
+                if self._info_on:
+                    self.logger.info(
+                        "SKILL: (%d) %s's %s activated, adding %d %s for %.2f seconds.",
+                        slot_idx + 1,
+                        item_name,
+                        skill_type,
+                        value,
+                        log_text,
+                        duration,
+                    )
             case "Spark":
                 threshold = (
                     skilled_item.get_skill_attribute_for_level(
@@ -494,10 +504,11 @@ class SkillActivationHandler:
                 )
 
                 if not threshold or state.spark_charges < threshold:
-                    self.logger.info(
-                        f"SKILL: ({slot_idx + 1}) {item_name}'s Spark failed to activate. "
-                        f"Needs {threshold} charges, has {state.spark_charges}."
-                    )
+                    if self._info_on:
+                        self.logger.info(
+                            f"SKILL: ({slot_idx + 1}) {item_name}'s Spark failed to activate. "
+                            f"Needs {threshold} charges, has {state.spark_charges}."
+                        )
                 else:
                     activated, charges, bonus, duration = (
                         effect_handler.apply_spark_effect(
@@ -510,11 +521,12 @@ class SkillActivationHandler:
                         )
                     )
                     if activated:
-                        self.logger.info(
-                            f"SKILL: ({slot_idx + 1}) {item_name}'s Spark activated, consuming {charges} charges. "
-                            f"Adds {bonus} to tap score for {duration:.2f} seconds. "
-                            f"{state.spark_charges} charges remaining."
-                        )
+                        if self._info_on:
+                            self.logger.info(
+                                f"SKILL: ({slot_idx + 1}) {item_name}'s Spark activated, consuming {charges} charges. "
+                                f"Adds {bonus} to tap score for {duration:.2f} seconds. "
+                                f"{state.spark_charges} charges remaining."
+                            )
 
         if isinstance(skilled_item, Card):
             self._process_year_group_triggers(
@@ -545,12 +557,13 @@ class SkillActivationHandler:
         if copied_slot is None:
             return
 
-        self.logger.info(
-            "SKILL: Encore copies %s from (%d) %s.",
-            copied_type,
-            copied_slot + 1,
-            copied_name,
-        )
+        if self._info_on:
+            self.logger.info(
+                "SKILL: Encore copies %s from (%d) %s.",
+                copied_type,
+                copied_slot + 1,
+                copied_name,
+            )
 
         match copied_type:
             case "Amplify":
@@ -619,6 +632,7 @@ class SkillActivationHandler:
                     value,
                     state.song_end_time,
                 )
+                effect_handler.refresh_bonus_totals(state)
             case "Appeal Boost":
                 effect_handler.apply_appeal_boost_effect(
                     state,
@@ -664,11 +678,12 @@ class SkillActivationHandler:
                     or 0
                 )
                 if not threshold or state.spark_charges < threshold:
-                    self.logger.info(
-                        "-> Copied Spark skill failed to activate. Needs %d charges, has %d.",
-                        threshold,
-                        state.spark_charges,
-                    )
+                    if self._info_on:
+                        self.logger.info(
+                            "-> Copied Spark skill failed to activate. Needs %d charges, has %d.",
+                            threshold,
+                            state.spark_charges,
+                        )
                 else:
                     activated, charges, bonus, duration = (
                         effect_handler.apply_spark_effect(
@@ -681,14 +696,15 @@ class SkillActivationHandler:
                         )
                     )
                     if activated:
-                        self.logger.info(
-                            "-> Copied Spark skill activated, consuming %d charges. "
-                            "Adds %d to tap score for %.2f seconds. %d charges remaining.",
-                            charges,
-                            bonus,
-                            duration,
-                            state.spark_charges,
-                        )
+                        if self._info_on:
+                            self.logger.info(
+                                "-> Copied Spark skill activated, consuming %d charges. "
+                                "Adds %d to tap score for %.2f seconds. %d charges remaining.",
+                                charges,
+                                bonus,
+                                duration,
+                                state.spark_charges,
+                            )
             case _:  # Handles Scorer/Healer
                 if (score_gain := copied_info.get("score_gain", 0)) > 0:
                     state.total_score += score_gain
@@ -705,19 +721,30 @@ class SkillActivationHandler:
         """
         Processes 'Year Group' skills that require multiple member activations.
         """
-        for receiver_idx, required in list(state.year_group_skill_trackers.items()):
-            if activating_character in required:
-                required.remove(activating_character)
+        activating_bit = play.character_bits.get(activating_character, 0)
+        trackers = state.year_group_skill_trackers
+        resets = state.year_group_tracker_resets
+        resets_at_start = dict(resets)
+        for receiver_idx in list(trackers):
+            # A tracker that fired and was reset by a skill this pass triggered
+            # has already been used up for this activation.
+            if resets.get(receiver_idx, 0) != resets_at_start.get(receiver_idx, 0):
+                continue
+            required = trackers[receiver_idx]
+            if required & activating_bit:
+                required &= ~activating_bit
+                trackers[receiver_idx] = required
 
                 # Check if all required members have now activated
                 if not required:
                     receiver_card = play.team.slots[receiver_idx].card
                     if receiver_card and receiver_card.skill.target:
-                        self.logger.info(
-                            "SKILL: (%d) %s's Year Group skill is now ready to activate.",
-                            receiver_idx + 1,
-                            receiver_card.display_name,
-                        )
+                        if self._info_on:
+                            self.logger.info(
+                                "SKILL: (%d) %s's Year Group skill is now ready to activate.",
+                                receiver_idx + 1,
+                                receiver_card.display_name,
+                            )
                         # Trigger the skill activation process for the year group card
                         self.process_triggers(
                             "Year Group",
@@ -728,11 +755,8 @@ class SkillActivationHandler:
                             current_time,
                         )
                         # Reset the tracker for this card for future activations
-                        target_group_name = receiver_card.skill.target
-                        all_members = play.game_data.sub_group_mapping.get(
-                            target_group_name, set()
-                        )
                         if receiver_card.character:
-                            state.year_group_skill_trackers[receiver_idx] = set(
-                                all_members
-                            ) - {receiver_card.character}
+                            trackers[receiver_idx] = play.year_group_mask(
+                                receiver_card
+                            )
+                            resets[receiver_idx] = resets.get(receiver_idx, 0) + 1
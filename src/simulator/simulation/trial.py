@@ -6,11 +6,11 @@ orchestrating specialized handlers.
 from __future__ import annotations
 
 import heapq
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, List
 
 import numpy as np
 
-from src.simulator.simulation.events import Event, EventType
+from src.simulator.simulation.events import Event
 from src.simulator.simulation.event_processor import EventProcessor
 from src.simulator.simulation.trial_state import TrialState
 
@@ -23,8 +23,9 @@ class Trial:
     Manages the setup and execution of a single simulation trial.
 
     This class initializes the trial's state and its various logic handlers,
-    builds the initial event queue, and runs the main event loop. It delegates
-    all event-specific logic to the EventProcessor.
+    and runs the main event loop over the Play's presorted song events and the
+    events scheduled by skills. It delegates all event-specific logic to the
+    EventProcessor.
     """
 
     def __init__(self, play_instance: "Play", random_state: np.random.Generator):
@@ -40,12 +41,24 @@ class Trial:
         # --- Dynamic State ---
         self.state = TrialState(random_state=random_state)
         self.state.current_slot_ppn = list(play_instance.base_slot_ppn)
+        num_notes = len(self.song.notes)
+        self.state.hold_note_start_results = bytearray(num_notes)
+        accuracy = self.config.accuracy
+        self.state.completion_rolls_perfect = (
+            random_state.random(num_notes) <= accuracy
+        ).tolist()
+        self.state.hold_start_rolls_perfect = (
+            random_state.random(num_notes) <= accuracy
+        ).tolist()
 
         self._cache_team_properties()
 
         self._initialize_trackers()
 
-        self.event_queue, self.song_end_time = self._build_event_queue()
+        # Heap of events scheduled by skills during the trial, such as effect
+        # ends. The song's own events come presorted from the Play.
+        self.event_queue: List[Event] = []
+        self.song_end_time = play_instance.song_end_time
         self.state.song_end_time = self.song_end_time
 
         processor_context = {
@@ -59,12 +72,30 @@ class Trial:
 
     def run(self):
         """
-        Executes the event loop for this trial until the queue is empty or
-        the song has ended.
+        Executes the event loop for this trial until both event streams are
+        exhausted or the song has ended.
+
+        The song's events are walked in their presorted order and skill events
+        are popped from the heap, always taking whichever of the two is next.
         """
-        while self.event_queue and not self.state.song_has_ended:
-            event = heapq.heappop(self.event_queue)
-            self.processor.dispatch(event, self.state, self.play, self.event_queue)
+        scheduled = self.play.scheduled_events
+        num_scheduled = len(scheduled)
+        next_scheduled = 0
+        event_queue = self.event_queue
+        state, play, dispatch = self.state, self.play, self.processor.dispatch
+
+        while not state.song_has_ended:
+            if event_queue and (
+                next_scheduled == num_scheduled
+                or event_queue[0] < scheduled[next_scheduled]
+            ):
+                event = heapq.heappop(event_queue)
+            elif next_scheduled < num_scheduled:
+                event = scheduled[next_scheduled]
+                next_scheduled += 1
+            else:
+                break
+            dispatch(event, state, play, event_queue)
 
     def _cache_team_properties(self):
         """Caches frequently accessed properties to reduce overhead."""
@@ -80,18 +111,25 @@ class Trial:
             if not card:
                 continue
 
-            if card.skill.activation == "Score":
+            if card.skill.activation in ("Rhythm Icons", "Perfects", "Combo"):
+                threshold = self.state.cached_skill_thresholds.get(idx)
+                if threshold:
+                    self.state.counter_skill_trackers[idx] = threshold
+
+            elif card.skill.activation == "Score":
                 threshold = self.state.cached_skill_thresholds.get(idx)
                 if threshold:
                     self.state.score_skill_trackers[idx] = threshold
 
             elif card.skill.activation == "Year Group" and card.skill.target:
-                all_members = self.game_data.sub_group_mapping.get(
-                    card.skill.target, set()
+                self.state.year_group_skill_trackers[idx] = self.play.year_group_mask(
+                    card
                 )
-                required_members = set(all_members) - {card.character}
-                self.state.year_group_skill_trackers[idx] = required_members
                 if self.logger:
+                    all_members = self.game_data.sub_group_mapping.get(
+                        card.skill.target, set()
+                    )
+                    required_members = set(all_members) - {card.character}
                     self.logger.debug(
                         "YEAR GROUP DBG: Initialized tracker for (%d) %s. Waiting for: %s",
                         idx + 1,
@@ -99,73 +137,6 @@ class Trial:
                         required_members or "{None}",
                     )
 
-    def _build_event_queue(self) -> Tuple[List[Event], float]:
-        """Creates the initial list of all events for the song."""
-        events: List[Event] = []
-        on_screen_duration = self.game_data.note_speed_map.get(
-            self.config.approach_rate, 1.0
-        )
-
-        last_note_completion_time = 0.0
-        if self.song.notes:
-            last_note_completion_time = max(note.end_time for note in self.song.notes)
-
-        for i, note in enumerate(self.song.notes):
-            # Note spawn events
-            heapq.heappush(
-                events,
-                Event(
-                    time=note.start_time - on_screen_duration,
-                    priority=EventType.NOTE_SPAWN,
-                    payload={"note_idx": i, "spawn_type": "start"},
-                ),
-            )
-            if note.start_time != note.end_time:  # Hold note
-                heapq.heappush(
-                    events,
-                    Event(
-                        time=note.end_time - on_screen_duration,
-                        priority=EventType.NOTE_SPAWN,
-                        payload={"note_idx": i, "spawn_type": "end"},
-                    ),
-                )
-                heapq.heappush(
-                    events,
-                    Event(
-                        time=note.start_time,
-                        priority=EventType.NOTE_START,
-                        payload={"note_idx": i},
-                    ),
-                )
-
-            # Note completion event
-            heapq.heappush(
-                events,
-                Event(
-                    time=note.end_time,
-                    priority=EventType.NOTE_COMPLETION,
-                    payload={"note_idx": i},
-                ),
-            )
-
-        # Song end event
-        song_end_time = last_note_completion_time + 0.001
-        heapq.heappush(events, Event(song_end_time, EventType.SONG_END))
-
-        # Time-based skill events
-        for slot_idx, card in self.state.cached_slot_cards.items():
-            if card and card.skill.activation == "Time":
-                threshold = self.state.cached_skill_thresholds.get(slot_idx)
-                if threshold and threshold > 0:
-                    for t in np.arange(threshold, self.song.length, threshold):
-                        payload = {"card": card, "slot_idx": slot_idx}
-                        heapq.heappush(
-                            events,
-                            Event(float(t), EventType.TIME_SKILL, payload=payload),
-                        )
-
-        return events, song_end_time
-
     def get_total_pl_uptime(self) -> float:
         """Calculates the total merged uptime for Perfect Lock effects."""
         intervals = self.state.uptime_intervals
@@ -200,6 +171,10 @@ class Trial:
         return self.state.notes_hit
 
     @property
-    def hold_note_start_results(self) -> Dict[int, str]:
-        """Convenience property to access hold start judgements from state."""
+    def hold_note_start_results(self) -> bytearray:
+        """
+        Convenience property to access hold start judgements from state.
+
+        Holds one `HOLD_START_*` code per note; non-hold notes stay unset.
+        """
         return self.state.hold_note_start_results
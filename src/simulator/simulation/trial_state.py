@@ -5,12 +5,17 @@ aspects of a single simulation trial.
 
 import uuid
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from src.simulator.card.card import Card
 
+# Hold note start judgements, as stored in `TrialState.hold_note_start_results`.
+HOLD_START_UNSET = 0
+HOLD_START_PERFECT = 1
+HOLD_START_GREAT = 2
+
 
 @dataclass(slots=True)
 class TrialState:
@@ -39,22 +44,35 @@ class TrialState:
     pl_uptime_start_time: Optional[float] = None
     uptime_intervals: List[Tuple[float, float]] = field(default_factory=list)
     total_trick_end_time: float = 0.0
+    # Notes completing at or before this time are locked to Perfect: infinite
+    # while any Perfect Lock is active, otherwise the Total Trick end time.
+    lock_active_until: float = 0.0
 
     active_sync_effects: Dict[int, Dict[str, Any]] = field(default_factory=dict)
     active_appeal_boost: Optional[Dict[str, Any]] = None
     active_sru_effect: Optional[Dict[str, Any]] = None
 
-    active_psu_effects: Dict[uuid.UUID, Dict[str, Any]] = field(default_factory=dict)
-    active_cbu_effects: Dict[uuid.UUID, Dict[str, Any]] = field(default_factory=dict)
-    active_spark_effects: Dict[uuid.UUID, Dict[str, Any]] = field(default_factory=dict)
+    # Bonus value of each active effect, keyed by the effect's unique ID.
+    active_psu_effects: Dict[uuid.UUID, float] = field(default_factory=dict)
+    active_cbu_effects: Dict[uuid.UUID, float] = field(default_factory=dict)
+    active_spark_effects: Dict[uuid.UUID, float] = field(default_factory=dict)
+    # Running sums of the PSU and Spark values above, refreshed by
+    # effect_handler.refresh_bonus_totals whenever either dict changes.
+    psu_bonus_total: float = 0
+    spark_bonus_total: float = 0
 
     active_amp_boost: int = 0
     spark_charges: int = 0
 
     # --- Skill Activation State ---
     last_skill_info: Optional[Dict[str, Any]] = None
+    # Counter value at which each Rhythm Icons/Perfects/Combo skill fires next.
+    counter_skill_trackers: Dict[int, int] = field(default_factory=dict)
     score_skill_trackers: Dict[int, int] = field(default_factory=dict)
-    year_group_skill_trackers: Dict[int, Set[str]] = field(default_factory=dict)
+    # Bitmask (see Play.character_bits) of the members each Year Group skill
+    # is still waiting on, and how many times each tracker has been reset.
+    year_group_skill_trackers: Dict[int, int] = field(default_factory=dict)
+    year_group_tracker_resets: Dict[int, int] = field(default_factory=dict)
 
     # These are populated once at the start of a trial to avoid repeated @property calls.
     cached_slot_cards: Dict[int, Optional[Card]] = field(default_factory=dict)
@@ -63,7 +81,12 @@ class TrialState:
     # --- Miscellaneous State ---
     # Determines skill processing order for simultaneous activations.
     coin_flip: bool = field(init=False)
-    hold_note_start_results: Dict[int, str] = field(default_factory=dict)
+    # Whether each note's accuracy roll is a Perfect, indexed by note_idx. The
+    # Trial draws them in bulk: one roll per completion, one per hold start.
+    completion_rolls_perfect: List[bool] = field(default_factory=list)
+    hold_start_rolls_perfect: List[bool] = field(default_factory=list)
+    # One HOLD_START_* code per note, indexed by note_idx; sized by the Trial.
+    hold_note_start_results: bytearray = field(default_factory=bytearray)
     song_has_ended: bool = False
 
     def __post_init__(self, random_state: np.random.Generator):
@@ -1,12 +1,17 @@
 import json
+import os
 import warnings
 from dataclasses import dataclass, fields
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple
 
 from src.simulator.core.leader_skill import LeaderSkill
 
+# Read-only stand-in for guest entries without an "extra" block.
+_NO_EXTRA = MappingProxyType({})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GuestData:
     """
     Represents the static, immutable data for a single guest leader skill,
@@ -24,7 +29,7 @@ class GuestData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GuestData":
         """Creates a GuestData instance from a dictionary, flattening the 'extra' key."""
-        extra_data = data.get("extra", {})
+        extra_data = data.get("extra") or _NO_EXTRA
         return cls(
             leader_skill_id=data["leader_skill_id"],
             leader_attribute=data.get("leader_attribute"),
@@ -36,6 +41,11 @@ class GuestData:
         )
 
 
+# Parsed guest files, keyed by absolute path and modification time. Every team
+# builds its own Guest, and GuestData is immutable, so the index can be shared.
+_guest_index_cache: Dict[Tuple[str, int], Dict[int, GuestData]] = {}
+
+
 class Guest:
     """Manages the active guest leader skill for a team."""
 
@@ -51,15 +61,27 @@ class Guest:
         return self._all_guests
 
     def _load_and_index_guests(self, filepath: str) -> Dict[int, GuestData]:
-        """Loads the JSON file and indexes the guest data by ID."""
+        """
+        Loads the JSON file and indexes the guest data by ID.
+
+        A file that has already been parsed and has not changed since is served
+        from a module-level cache; failed loads are not cached.
+        """
         try:
+            cache_key = (os.path.abspath(filepath), os.stat(filepath).st_mtime_ns)
+            cached = _guest_index_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
             with open(filepath, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
             if not isinstance(data, list):
                 raise TypeError("Guest data must be a list of objects.")
 
-            return {item["leader_skill_id"]: GuestData.from_dict(item) for item in data}
+            index = {item["leader_skill_id"]: GuestData.from_dict(item) for item in data}
+            _guest_index_cache[cache_key] = index
+            return dict(index)
         except (FileNotFoundError, json.JSONDecodeError, TypeError) as e:
             print(f"Error loading or parsing guest data from {filepath}: {e}")
             return {}
@@ -2,7 +2,7 @@ import os
 import json
 import warnings
 import math
-from typing import List, Optional, Set, Dict
+from typing import List, Optional, Set, Dict, Tuple
 
 from src.simulator.card.card import Card
 from src.simulator.card.deck import Deck
@@ -14,6 +14,10 @@ from src.simulator.sis.sis_manager import SISManager
 from src.simulator.team.guest import Guest
 from src.simulator.team.team_slot import TeamSlot
 
+# Parsed group mapping files, keyed by absolute path and modification time.
+# Every Team loads the same files and only reads them, so they are shared.
+_json_mapping_cache: Dict[Tuple[str, int], Dict[str, Set[str]]] = {}
+
 
 class Team:
     """
@@ -26,11 +30,25 @@ class Team:
     def _load_json_mapping(
         self, filepath: str, warning_message: str
     ) -> Dict[str, Set[str]]:
-        """Generic helper to load a JSON file mapping groups to character sets."""
+        """
+        Generic helper to load a JSON file mapping groups to character sets.
+
+        A file that has already been parsed and has not changed since is served
+        from a module-level cache; failed loads are not cached.
+        """
         try:
+            cache_key = (os.path.abspath(filepath), os.stat(filepath).st_mtime_ns)
+            cached = _json_mapping_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             with open(filepath, "r", encoding="utf-8") as f:
                 raw_mapping = json.load(f)
-            return {group: set(characters) for group, characters in raw_mapping.items()}
+            mapping = {
+                group: set(characters) for group, characters in raw_mapping.items()
+            }
+            _json_mapping_cache[cache_key] = mapping
+            return mapping
         except (FileNotFoundError, json.JSONDecodeError, TypeError) as e:
             warnings.warn(f"{warning_message} from '{filepath}': {e}.")
             return {}
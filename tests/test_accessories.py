@@ -68,6 +68,17 @@ class TestAccessory(unittest.TestCase):
         )
         self.assertEqual(chance_at_lvl_10, 40)
 
+    def test_skill_values_follow_skill_level(self):
+        """Verify cached skill values are refreshed when the skill level changes."""
+        test_accessory = self.factory.create_accessory(1)
+        self.assertEqual(test_accessory.skill_chance, 25)
+        self.assertEqual(test_accessory.skill_value, 20)
+
+        test_accessory.skill_level = 3
+        self.assertEqual(test_accessory.skill_chance, 35)
+        self.assertEqual(test_accessory.skill_value, 26)
+        self.assertEqual(test_accessory.skill_duration, 4.2)
+
     def test_repr_output(self):
         """Verify the __repr__ method produces the correct, formatted output."""
         test_accessory = self.factory.create_accessory(1, skill_level=2)
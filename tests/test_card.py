@@ -71,6 +71,14 @@ class TestCardFactory(unittest.TestCase):
             f"Skill Chance: {test_card.skill_chance}", "Skill Chance: 0.52"
         )
 
+    def test_skill_values_follow_skill_level(self):
+        """Verify cached skill values are refreshed when the skill level changes."""
+        test_card = self.factory.create_card(101, self.gallery_bonus)
+        self.assertEqual(test_card.skill_chance, 0.36)
+
+        test_card.current_skill_level = 5
+        self.assertEqual(test_card.skill_chance, 0.52)
+
     def test_skill_level_out_of_range(self):
         with self.assertWarns(UserWarning) as cm:
             test_card = self.factory.create_card(
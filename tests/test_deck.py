@@ -121,6 +121,20 @@ Total cards in deck: 1
 --------------------------"""
         self.assertEqual(self.captured_output.getvalue().strip(), expected)
 
+    def test_modify_card_skill_level_and_sis_slots(self):
+        test_deck = Deck(self.factory)
+        test_deck.add_card(1000, idolized=True, skill_level=4)
+        card = test_deck.get_card(1)
+
+        self.assertTrue(test_deck.modify_card(deck_id=1, skill_level=6, sis_slots=3))
+        self.assertIs(test_deck.get_card(1), card)
+        self.assertEqual(card.current_skill_level, 6)
+        self.assertEqual(card.current_sis_slots, 3)
+
+        with self.assertWarns(UserWarning):
+            test_deck.modify_card(deck_id=1, skill_level=20)
+        self.assertEqual(test_deck.get_card(1).current_skill_level, 1)
+
     def test_remove_card(self):
         test_deck = Deck(self.factory)
         test_deck.add_card(1000, idolized=False, skill_level=4)
@@ -65,6 +65,15 @@ Leader Extra Value: N/A
 ---------------------------"""
         self.assertEqual(self.captured_output.getvalue().strip(), expected)
 
+    def test_reloaded_guests_are_independent(self):
+        """A second Guest for the same file gets the same data in its own index."""
+        other_manager = Guest(self.GUEST_FILE_PATH)
+        self.assertEqual(other_manager.all_guests, self.guest_manager.all_guests)
+        self.assertIsNot(other_manager.all_guests, self.guest_manager.all_guests)
+
+        other_manager.set_guest(25)
+        self.assertIsNone(self.guest_manager.current_guest)
+
 
 if __name__ == "__main__":
     unittest.main(argv=["first-arg-is-ignored"], exit=False)
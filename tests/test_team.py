@@ -57,6 +57,12 @@ class TestTeam(unittest.TestCase):
 
         warnings.simplefilter("ignore", UserWarning)
 
+    def test_group_mappings_shared_between_teams(self):
+        """A second Team reuses the group mappings parsed for the first."""
+        other_team = Team(self.deck, self.accessory_manager, self.sis_manager)
+        self.assertIs(other_team._year_group_mapping, self.team._year_group_mapping)
+        self.assertIs(other_team._group_member_mapping, self.team._group_member_mapping)
+
     def test_empty_team(self):
         """Test the string representation of a newly created, empty team."""
         expected = """